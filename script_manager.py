@@ -7,194 +7,544 @@ Author: Tiago José M Silva
 """
 
 import os
+import re
 import sys
+import bisect
+import ctypes
+import platform
+import subprocess
 import traceback
 import io
+import json
+import time
+import threading
 import contextlib
+import functools
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
-from qgis.PyQt.QtCore import QTimer, QFileSystemWatcher, pyqtSignal, QObject, QSettings, QT_VERSION_STR
+from qgis.PyQt.QtCore import (QTimer, QFileSystemWatcher, pyqtSignal, QObject, QSettings, QT_VERSION_STR,
+                              QRunnable, QThreadPool)
 from qgis.PyQt.QtWidgets import (QApplication, QAction, QMenu, QMessageBox, QDialog, QVBoxLayout, 
                                 QHBoxLayout, QListWidget, QListWidgetItem, QLabel, 
                                 QPushButton, QTextEdit, QSplitter, QWidget, QScrollArea,
                                 QTabWidget, QPlainTextEdit)
-from qgis.PyQt.QtGui import QIcon, QFont, QTextCursor
+from qgis.PyQt.QtGui import QIcon, QFont
 from qgis.PyQt.QtCore import Qt
 
 QT_VERSION = 6 if QT_VERSION_STR.startswith('6') else 5
 
-from qgis.core import QgsMessageLog, Qgis
+from qgis.core import QgsApplication, QgsMessageLog, Qgis
 from qgis.utils import iface
 
 
+# A "Description:" line in any supported language, optionally opening a
+# docstring or comment; anchored to line starts so code mentioning the word is skipped
+_DESCRIPTION_RE = re.compile(
+    r'^[ \t]*(?:#|[rRuU]?(?:"""|\'\'\'))?[ \t]*'
+    r'(?:Description|Descrição|Descripción)[ \t]*:[ \t]*(.+)$',
+    re.IGNORECASE | re.MULTILINE
+)
+# Metadata lives in the top docstring, so only this many characters are read,
+# plus one extension when a docstring is still open at the end of the header
+_HEADER_SIZE = 4096
+_HEADER_EXTENSION = 8192
+# Deletes both quote characters from a description in one pass
+_QUOTE_STRIP = str.maketrans('', '', '"\'')
+
+
+def _find_description(header):
+    """Return the text of the first description line in header, or None"""
+    match = _DESCRIPTION_RE.search(header)
+    return match.group(1).strip() if match else None
+
+
+def _has_open_docstring(header):
+    return header.count('"""') % 2 == 1 or header.count("'''") % 2 == 1
+
+
+# Substrings flagged by SafeScriptExecutor.validate_script_imports
+_RISKY_OPERATIONS = (
+    'subprocess.call',
+    'subprocess.run',
+    'subprocess.Popen',
+    'os.system',
+    'eval(',
+    'exec(',
+    '__import__',
+)
+
+# One alternation per source type, so a single pass finds every operation
+_RISKY_RE = re.compile('|'.join(map(re.escape, _RISKY_OPERATIONS)))
+_RISKY_RE_BYTES = re.compile(_RISKY_RE.pattern.encode('ascii'))
+
+# Idle (stdout, stderr) capture buffers shared by all executors
+_BUFFER_POOL = []
+_BUFFER_POOL_SIZE = 8
+
+# Below this many scripts, a thread pool costs more than it saves
+_PARALLEL_LOAD_THRESHOLD = 8
+
+# Folder opener resolved once for the running platform; Popen keeps the UI responsive
+if platform.system() == "Windows":
+    _OPEN_FOLDER = os.startfile
+elif platform.system() == "Darwin":
+    _OPEN_FOLDER = lambda path: subprocess.Popen(["open", path], start_new_session=True)
+else:
+    # xdg-open may chatter on stdio and outlive us; detach it completely
+    _OPEN_FOLDER = lambda path: subprocess.Popen(["xdg-open", path], start_new_session=True,
+                                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+# Filesystems whose change notifications are unreliable, so the watcher also polls
+_NETWORK_FS_TYPES = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'afs', '9p', 'fuse.sshfs', 'fuse.rclone',
+})
+_NETWORK_POLL_INTERVAL = 30000
+
+
+def _is_network_fs(path):
+    """Best-effort check for a path on a network share (Linux and Windows)"""
+    path = os.path.realpath(path)
+    try:
+        if platform.system() == "Windows":
+            if path.startswith('\\\\'):
+                return True
+            DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(os.path.splitdrive(path)[0] + '\\') == DRIVE_REMOTE
+        
+        # The longest mount point containing the path decides its filesystem
+        best_mount, best_type = '', ''
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace('\\040', ' ')
+                if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) \
+                        and len(mount_point) > len(best_mount):
+                    best_mount, best_type = mount_point, fields[2]
+        return best_type in _NETWORK_FS_TYPES
+    except Exception:
+        return False
+
+@contextlib.contextmanager
+def script_dir_on_path(script_dir):
+    """Temporarily put a script's folder at the front of sys.path"""
+    inserted = script_dir not in sys.path
+    if inserted:
+        sys.path.insert(0, script_dir)
+    try:
+        yield
+    finally:
+        if inserted:
+            try:
+                sys.path.remove(script_dir)
+            except ValueError:
+                pass
+
+
+def script_jit(func):
+    """Decorator offered to scripts as 'jit': compiles numeric functions with
+    numba when it is installed, falling back to plain Python otherwise"""
+    # numba's default __pycache__ sits inside the watched scripts folder, where every
+    # compile would trigger a rescan; keep it in the QGIS profile unless the user chose one
+    cache_dir = os.environ.setdefault(
+        'NUMBA_CACHE_DIR', os.path.join(QgsApplication.qgisSettingsDirPath(), 'script_manager_numba_cache'))
+    try:
+        import numba
+    except ImportError:
+        return func
+    # The variable is only read on numba's first import, which may have happened elsewhere
+    if not numba.config.CACHE_DIR:
+        numba.config.CACHE_DIR = cache_dir
+    
+    compiled = numba.njit(cache=True)(func)
+    state = {'impl': compiled}
+    
+    @functools.wraps(func)
+    def call(*args, **kwargs):
+        try:
+            return state['impl'](*args, **kwargs)
+        except numba.core.errors.NumbaError as e:
+            # Unsupported code (e.g. heavy string use): run the original from now on
+            QgsMessageLog.logMessage(f"numba could not compile {func.__name__}, using Python: {str(e)}", 
+                                   "Script Manager", Qgis.Warning)
+            state['impl'] = func
+            return func(*args, **kwargs)
+    
+    return call
+
+
 class SafeScriptExecutor:
     """Script executor with output capture and error handling"""
     
     def __init__(self):
-        self.output_buffer = io.StringIO()
-        self.error_buffer = io.StringIO()
+        self._captured = ("", "")
+        self._code_cache = {}
     
     @contextlib.contextmanager
     def capture_output(self):
         """Context manager to capture stdout and stderr"""
+        output_buffer, error_buffer = _BUFFER_POOL.pop() if _BUFFER_POOL else (io.StringIO(), io.StringIO())
         old_stdout = sys.stdout
         old_stderr = sys.stderr
         try:
-            sys.stdout = self.output_buffer
-            sys.stderr = self.error_buffer
+            sys.stdout = output_buffer
+            sys.stderr = error_buffer
             yield
         finally:
             sys.stdout = old_stdout
             sys.stderr = old_stderr
+            self._captured = (output_buffer.getvalue(), error_buffer.getvalue())
+            
+            # Reset and hand the pair back for the next capture
+            output_buffer.seek(0)
+            output_buffer.truncate()
+            error_buffer.seek(0)
+            error_buffer.truncate()
+            if len(_BUFFER_POOL) < _BUFFER_POOL_SIZE:
+                _BUFFER_POOL.append((output_buffer, error_buffer))
     
     def get_captured_output(self):
         """Get captured output and errors"""
-        output = self.output_buffer.getvalue()
-        errors = self.error_buffer.getvalue()
-        
-        self.output_buffer.truncate(0)
-        self.output_buffer.seek(0)
-        self.error_buffer.truncate(0)
-        self.error_buffer.seek(0)
-        
-        return output, errors
+        captured = self._captured
+        self._captured = ("", "")
+        return captured
+    
+    def get_code(self, script_path):
+        """Return the compiled code and validation warnings, recompiling only when the file changed"""
+        st = os.stat(script_path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._code_cache.get(script_path)
+        if cached and cached[0] == key:
+            return cached[1], cached[2]
+        
+        # compile() decodes bytes itself, honouring any coding cookie
+        with open(script_path, 'rb') as f:
+            source = f.read()
+        
+        code = compile(source, script_path, 'exec')
+        validation_warnings = self.validate_script_imports(source)
+        self._code_cache[script_path] = (key, code, validation_warnings)
+        return code, validation_warnings
+    
+    def forget_missing(self, live_paths):
+        """Drop compiled code for scripts that no longer exist"""
+        for path in self._code_cache.keys() - live_paths:
+            del self._code_cache[path]
     
     def validate_script_imports(self, script_content):
-        """Validate script imports for security"""
-        risky_imports = [
-            'subprocess.call',
-            'subprocess.run',
-            'subprocess.Popen',
-            'os.system',
-            'eval(',
-            'exec(',
-            '__import__',
-        ]
-        
-        warnings = []
-        for risky in risky_imports:
-            if risky in script_content:
-                warnings.append(f"⚠️ Potentially risky operation detected: {risky}")
-        
-        return warnings
+        """Validate script imports for security (accepts source as str or bytes)"""
+        if isinstance(script_content, bytes):
+            found = {m.group(0).decode('ascii') for m in _RISKY_RE_BYTES.finditer(script_content)}
+        else:
+            found = {m.group(0) for m in _RISKY_RE.finditer(script_content)}
+        
+        return [f"⚠️ Potentially risky operation detected: {risky}"
+                for risky in _RISKY_OPERATIONS if risky in found]
     
     def prepare_safe_namespace(self, script_path):
         """Prepare a safe execution namespace with necessary imports"""
-        script_globals = {
-            '__name__': '__main__',
-            '__file__': script_path,
-            'QT_VERSION': QT_VERSION,
-        }
-        
-        try:
-            from qgis.core import (
-                QgsProject, QgsVectorLayer, QgsRasterLayer, QgsMessageLog, 
-                Qgis, QgsUnitTypes, QgsWkbTypes, QgsFeature, QgsGeometry,
-                QgsCoordinateReferenceSystem, QgsCoordinateTransform,
-                QgsMapLayerProxyModel, QgsProcessingContext
-            )
-            from qgis.gui import QgsMapCanvas, QgsMapTool
-            from qgis.utils import iface as qgis_iface
-            
-            script_globals.update({
-                'QgsProject': QgsProject,
-                'QgsVectorLayer': QgsVectorLayer,
-                'QgsRasterLayer': QgsRasterLayer,
-                'QgsFeature': QgsFeature,
-                'QgsGeometry': QgsGeometry,
-                'QgsCoordinateReferenceSystem': QgsCoordinateReferenceSystem,
-                'QgsCoordinateTransform': QgsCoordinateTransform,
-                'QgsMessageLog': QgsMessageLog,
-                'QgsUnitTypes': QgsUnitTypes,
-                'QgsWkbTypes': QgsWkbTypes,
-                'QgsMapCanvas': QgsMapCanvas,
-                'QgsMapTool': QgsMapTool,
-                'QgsMapLayerProxyModel': QgsMapLayerProxyModel,
-                'QgsProcessingContext': QgsProcessingContext,
-                'iface': qgis_iface,
-                'Qgis': Qgis,
-            })
-        except ImportError as e:
-            QgsMessageLog.logMessage(f"Warning: Some QGIS imports failed: {str(e)}", 
-                                   "Script Manager", Qgis.Warning)
-        
-        try:
-            from qgis.PyQt.QtWidgets import (QMessageBox, QInputDialog, QFileDialog, 
-                                           QProgressBar, QComboBox, QCheckBox)
-            from qgis.PyQt.QtCore import Qt, QTimer, QThread, pyqtSignal
-            from qgis.PyQt.QtGui import QIcon, QPixmap, QColor
-            
-            script_globals.update({
-                'QMessageBox': QMessageBox,
-                'QInputDialog': QInputDialog,
-                'QFileDialog': QFileDialog,
-                'QProgressBar': QProgressBar,
-                'QComboBox': QComboBox,
-                'QCheckBox': QCheckBox,
-                'Qt': Qt,
-                'QTimer': QTimer,
-                'QThread': QThread,
-                'pyqtSignal': pyqtSignal,
-                'QIcon': QIcon,
-                'QPixmap': QPixmap,
-                'QColor': QColor
-            })
-        except ImportError as e:
-            QgsMessageLog.logMessage(f"Warning: Some Qt imports failed: {str(e)}", 
-                                   "Script Manager", Qgis.Warning)
-        
-        try:
-            import json, math, datetime, re
-            script_globals.update({
-                'json': json,
-                'math': math,
-                'datetime': datetime,
-                're': re,
-            })
-        except ImportError as e:
-            QgsMessageLog.logMessage(f"Warning: Some standard library imports failed: {str(e)}", 
-                                   "Script Manager", Qgis.Warning)
-        
+        script_globals = get_script_globals_template().copy()
+        script_globals['__file__'] = script_path
         return script_globals
 
 
+_executor = None
+
+def get_executor():
+    """Return the shared SafeScriptExecutor, so its code cache outlives plugin instances"""
+    global _executor
+    if _executor is None:
+        _executor = SafeScriptExecutor()
+    return _executor
+
+
+def _build_script_globals_template():
+    """Build the names every executed script gets, importing them once"""
+    script_globals = {
+        '__name__': '__main__',
+        'QT_VERSION': QT_VERSION,
+    }
+    
+    try:
+        # QgsMessageLog and Qgis come from the module imports so the except
+        # branches below can still use them if this import fails
+        from qgis.core import (
+            QgsProject, QgsVectorLayer, QgsRasterLayer,
+            QgsUnitTypes, QgsWkbTypes, QgsFeature, QgsGeometry,
+            QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+            QgsMapLayerProxyModel, QgsProcessingContext
+        )
+        from qgis.gui import QgsMapCanvas, QgsMapTool
+        from qgis.utils import iface as qgis_iface
+        
+        script_globals.update({
+            'QgsProject': QgsProject,
+            'QgsVectorLayer': QgsVectorLayer,
+            'QgsRasterLayer': QgsRasterLayer,
+            'QgsFeature': QgsFeature,
+            'QgsGeometry': QgsGeometry,
+            'QgsCoordinateReferenceSystem': QgsCoordinateReferenceSystem,
+            'QgsCoordinateTransform': QgsCoordinateTransform,
+            'QgsMessageLog': QgsMessageLog,
+            'QgsUnitTypes': QgsUnitTypes,
+            'QgsWkbTypes': QgsWkbTypes,
+            'QgsMapCanvas': QgsMapCanvas,
+            'QgsMapTool': QgsMapTool,
+            'QgsMapLayerProxyModel': QgsMapLayerProxyModel,
+            'QgsProcessingContext': QgsProcessingContext,
+            'iface': qgis_iface,
+            'Qgis': Qgis,
+        })
+    except ImportError as e:
+        QgsMessageLog.logMessage(f"Warning: Some QGIS imports failed: {str(e)}", 
+                               "Script Manager", Qgis.Warning)
+    
+    try:
+        from qgis.PyQt.QtWidgets import (QMessageBox, QInputDialog, QFileDialog, 
+                                       QProgressBar, QComboBox, QCheckBox)
+        from qgis.PyQt.QtCore import Qt, QTimer, QThread, pyqtSignal
+        from qgis.PyQt.QtGui import QIcon, QPixmap, QColor
+        
+        script_globals.update({
+            'QMessageBox': QMessageBox,
+            'QInputDialog': QInputDialog,
+            'QFileDialog': QFileDialog,
+            'QProgressBar': QProgressBar,
+            'QComboBox': QComboBox,
+            'QCheckBox': QCheckBox,
+            'Qt': Qt,
+            'QTimer': QTimer,
+            'QThread': QThread,
+            'pyqtSignal': pyqtSignal,
+            'QIcon': QIcon,
+            'QPixmap': QPixmap,
+            'QColor': QColor
+        })
+    except ImportError as e:
+        QgsMessageLog.logMessage(f"Warning: Some Qt imports failed: {str(e)}", 
+                               "Script Manager", Qgis.Warning)
+    
+    try:
+        import json, math, datetime, re
+        script_globals.update({
+            'json': json,
+            'math': math,
+            'datetime': datetime,
+            're': re,
+            'jit': script_jit,
+        })
+    except ImportError as e:
+        QgsMessageLog.logMessage(f"Warning: Some standard library imports failed: {str(e)}", 
+                               "Script Manager", Qgis.Warning)
+    
+    return script_globals
+
+
+_script_globals_template = None
+
+def get_script_globals_template():
+    """Return the shared script namespace, importing its modules on first execution"""
+    global _script_globals_template
+    if _script_globals_template is None:
+        _script_globals_template = _build_script_globals_template()
+    return _script_globals_template
+
+
+# Qt5/Qt6 enum differences resolved once at import time
+if QT_VERSION == 6:
+    USER_ROLE = Qt.ItemDataRole.UserRole
+    HORIZONTAL = Qt.Orientation.Horizontal
+    RICH_TEXT = Qt.TextFormat.RichText
+    BOLD = QFont.Weight.Bold
+    EXEC_DIALOG = QDialog.exec
+else:
+    USER_ROLE = Qt.UserRole
+    HORIZONTAL = Qt.Horizontal
+    RICH_TEXT = Qt.RichText
+    BOLD = QFont.Bold
+    EXEC_DIALOG = QDialog.exec_
+
+# Shared bold fonts; QFont is implicitly shared, so reusing them is safe
+_FONT_BOLD_9 = QFont("", 9, BOLD)
+_FONT_BOLD_11 = QFont("", 11, BOLD)
+_FONT_BOLD_12 = QFont("", 12, BOLD)
+
+
 class QtCompat:
     """Qt compatibility helper for Qt5/Qt6 differences"""
     
     @staticmethod
     def get_user_role():
-        if QT_VERSION == 6:
-            return Qt.ItemDataRole.UserRole
-        else:
-            return Qt.UserRole
+        return USER_ROLE
     
     @staticmethod
     def get_horizontal():
-        if QT_VERSION == 6:
-            return Qt.Orientation.Horizontal
-        else:
-            return Qt.Horizontal
+        return HORIZONTAL
     
     @staticmethod
     def get_rich_text():
-        if QT_VERSION == 6:
-            return Qt.TextFormat.RichText
-        else:
-            return Qt.RichText
+        return RICH_TEXT
     
     @staticmethod
     def get_font_weight_bold():
-        if QT_VERSION == 6:
-            return QFont.Weight.Bold
-        else:
-            return QFont.Bold
+        return BOLD
     
     @staticmethod
     def exec_dialog(dialog):
-        if QT_VERSION == 6:
-            return dialog.exec()
-        else:
-            return dialog.exec_()
+        return EXEC_DIALOG(dialog)
+
+
+_TR_EN = {
+    'script_manager': 'Script Manager',
+    'script_browser': 'Script Browser',
+    'quick_access': 'Quick Access',
+    'reload_scripts': 'Reload Scripts',
+    'open_scripts_folder': 'Open Scripts Folder',
+    'about': 'About',
+    'no_scripts_found': 'No scripts found',
+    'loading_scripts': 'Loading scripts...',
+    'available_scripts': 'Available Scripts',
+    'scripts_found': 'scripts found',
+    'scripts': 'Scripts:',
+    'select_script': 'Select a script',
+    'description': 'Description:',
+    'location': 'Location:',
+    'file': 'File:',
+    'execute_script': 'Execute Script',
+    'refresh_list': 'Refresh List',
+    'open_folder': 'Open Folder',
+    'close': 'Close',
+    'no_script_selected': 'No script selected',
+    'output': 'Output',
+    'console_output': 'Console Output',
+    'clear_output': 'Clear Output',
+    'warnings': 'Warnings',
+    'script_executed': 'Script executed successfully!',
+    'script_executed_warnings': 'Script executed with warnings',
+    'error_executing': 'Error executing script',
+    'scripts_reloaded': 'Scripts reloaded',
+    'browser_opened': 'Browser opened with',
+    'no_scripts_warning': 'No scripts found in folder',
+    'error_opening_folder': 'Error opening folder',
+    'output_captured': 'Output captured from script',
+    'about_title': 'Script Manager v1.0',
+    'about_subtitle': 'PyQGIS Script Management Plugin',
+    'about_description': 'The Script Manager plugin provides an intuitive interface for organizing and executing PyQGIS scripts within QGIS.',
+    'key_features': 'Key Features:',
+    'feature_browser': 'Script Browser with output capture and detailed error reporting',
+    'feature_quick': 'Quick Access menu with hover tooltips for fast script execution',
+    'feature_monitor': 'Auto-monitoring: Automatically detects scripts added, removed or renamed in the folder',
+    'feature_management': 'Easy Management: Direct access to scripts folder and reload functionality',
+    'feature_safety': 'Safe Execution: Script validation and error handling',
+    'feature_output_capture': 'Output Capture: All print statements are captured and displayed',
+    'feature_crash_prevention': 'Crash Prevention: Safe execution environment with error handling',
+    'feature_script_validation': 'Script Validation: Pre-execution checks for security',
+    'scripts_location': 'Scripts Location:',
+    'currently_loaded': 'Currently loaded:',
+    'getting_started': 'Getting Started:',
+    'getting_started_1': '1. Click "Script Browser" to explore available scripts',
+    'getting_started_2': '2. Use "Quick Access" for fast script execution',
+    'getting_started_3': '3. Place your .py files in the scripts folder',
+    'getting_started_4': '4. Use "Reload Scripts" to refresh the list',
+    'getting_started_5': '5. Use print() statements in your scripts for output capture',
+    'script_format': 'Script Format Example:',
+    'error': 'Error',
+    'script_error': 'Script Error',
+    'validation_warnings': 'Script Validation Warnings',
+    'check_log': 'Check QGIS log for more details.',
+    'tooltip_browser': 'Open browser with detailed script descriptions and output capture',
+    'tooltip_reload': 'Reload all scripts from folder',
+    'tooltip_folder': 'Open the folder where scripts are stored',
+    'tooltip_about': 'Information about Script Manager'
+}
+
+_TR_PT_BR = {
+    'script_manager': 'Gerenciador de Scripts',
+    'script_browser': 'Navegador de Scripts',
+    'quick_access': 'Acesso Rápido',
+    'reload_scripts': 'Recarregar Scripts',
+    'open_scripts_folder': 'Abrir Pasta de Scripts',
+    'about': 'Sobre',
+    'no_scripts_found': 'Nenhum script encontrado',
+    'loading_scripts': 'Carregando scripts...',
+    'available_scripts': 'Scripts Disponíveis',
+    'scripts_found': 'scripts encontrados',
+    'scripts': 'Scripts:',
+    'select_script': 'Selecione um script',
+    'description': 'Descrição:',
+    'location': 'Localização:',
+    'file': 'Arquivo:',
+    'execute_script': 'Executar Script',
+    'refresh_list': 'Atualizar Lista',
+    'open_folder': 'Abrir Pasta',
+    'close': 'Fechar',
+    'no_script_selected': 'Nenhum script selecionado',
+    'output': 'Saída',
+    'console_output': 'Saída do Console',
+    'clear_output': 'Limpar Saída',
+    'warnings': 'Avisos',
+    'script_executed': 'Script executado com sucesso!',
+    'script_executed_warnings': 'Script executado com avisos',
+    'error_executing': 'Erro ao executar script',
+    'scripts_reloaded': 'Scripts recarregados',
+    'browser_opened': 'Navegador aberto com',
+    'no_scripts_warning': 'Nenhum script encontrado na pasta',
+    'error_opening_folder': 'Erro ao abrir pasta',
+    'output_captured': 'Saída capturada do script',
+    'about_title': 'Gerenciador de Scripts v1.0',
+    'about_subtitle': 'Plugin de Gerenciamento de Scripts PyQGIS',
+    'about_description': 'O plugin Gerenciador de Scripts fornece uma interface intuitiva para organizar e executar scripts PyQGIS dentro do QGIS.',
+    'key_features': 'Principais Recursos:',
+    'feature_browser': 'Navegador de Scripts com captura de saída e relatório detalhado de erros',
+    'feature_quick': 'Menu de Acesso Rápido com dicas ao passar o mouse para execução rápida',
+    'feature_monitor': 'Monitoramento Automático: Detecta automaticamente scripts adicionados, removidos ou renomeados na pasta',
+    'feature_management': 'Gerenciamento Fácil: Acesso direto à pasta de scripts e funcionalidade de recarregamento',
+    'feature_safety': 'Execução Segura: Validação de script e tratamento de erros',
+    'feature_output_capture': 'Captura de Saída: Todas as mensagens print são capturadas e exibidas',
+    'feature_crash_prevention': 'Prevenção de Crashes: Ambiente de execução seguro com tratamento de erros',
+    'feature_script_validation': 'Validação de Scripts: Verificações pré-execução para segurança',
+    'scripts_location': 'Localização dos Scripts:',
+    'currently_loaded': 'Atualmente carregados:',
+    'getting_started': 'Como Começar:',
+    'getting_started_1': '1. Clique em "Navegador de Scripts" para explorar scripts disponíveis',
+    'getting_started_2': '2. Use "Acesso Rápido" para execução rápida de scripts',
+    'getting_started_3': '3. Coloque seus arquivos .py na pasta de scripts',
+    'getting_started_4': '4. Use "Recarregar Scripts" para atualizar a lista',
+    'getting_started_5': '5. Use comandos print() nos seus scripts para captura de saída',
+    'script_format': 'Exemplo de Formato de Script:',
+    'error': 'Erro',
+    'script_error': 'Erro no Script',
+    'validation_warnings': 'Avisos de Validação do Script',
+    'check_log': 'Verifique o log do QGIS para mais detalhes.',
+    'tooltip_browser': 'Abrir navegador com descrições detalhadas dos scripts e captura de saída',
+    'tooltip_reload': 'Recarregar todos os scripts da pasta',
+    'tooltip_folder': 'Abrir a pasta onde os scripts são armazenados',
+    'tooltip_about': 'Informações sobre o Gerenciador de Scripts'
+}
+
+_LANGUAGE_MAP = {
+    'pt': 'pt_BR',
+    'es': 'es_ES',
+    'fr': 'fr_FR',
+    'de': 'de_DE',
+    'it': 'it_IT',
+}
+
+# QGIS locale is fixed for the session, so read it once
+try:
+    _CACHED_LOCALE = QSettings().value('locale/userLocale', 'en_US') or 'en_US'
+except Exception:
+    _CACHED_LOCALE = os.environ.get('LANG', 'en_US')
+
+_TRANSLATIONS = {
+    'en': _TR_EN,
+    'pt_BR': _TR_PT_BR,
+}
 
 
 class Translator:
@@ -202,173 +552,73 @@ class Translator:
     
     def __init__(self):
         self.current_language = self.detect_qgis_language()
-        self.translations = self.load_translations()
+        translations = self.load_translations()
+        if self.current_language in translations and self.current_language != 'en':
+            self._active = {**translations['en'], **translations[self.current_language]}
+        else:
+            # English (or an untranslated locale) reads the shared table directly
+            self._active = translations['en']
+        self.labels = self.build_labels()
     
     def detect_qgis_language(self):
         try:
-            settings = QSettings()
-            locale = settings.value('locale/userLocale', 'en_US')
-            language = locale[:2].lower()
-            
-            language_map = {
-                'pt': 'pt_BR',
-                'es': 'es_ES',
-                'fr': 'fr_FR',
-                'de': 'de_DE',
-                'it': 'it_IT',
-            }
-            
-            return language_map.get(language, language)
+            language = _CACHED_LOCALE[:2].lower()
+            return _LANGUAGE_MAP.get(language, language)
             
         except Exception:
             return 'en'
     
     def load_translations(self):
+        """Return only the English fallback and the active language"""
+        translations = {'en': _TR_EN}
+        if self.current_language in _TRANSLATIONS:
+            translations[self.current_language] = _TRANSLATIONS[self.current_language]
+        return translations
+    
+    def build_labels(self):
+        """Precompose the decorated labels used by the menu and script browser"""
+        t = self._active
         return {
-            'en': {
-                'script_manager': 'Script Manager',
-                'script_browser': 'Script Browser',
-                'quick_access': 'Quick Access',
-                'reload_scripts': 'Reload Scripts',
-                'open_scripts_folder': 'Open Scripts Folder',
-                'about': 'About',
-                'no_scripts_found': 'No scripts found',
-                'available_scripts': 'Available Scripts',
-                'scripts_found': 'scripts found',
-                'scripts': 'Scripts:',
-                'select_script': 'Select a script',
-                'description': 'Description:',
-                'location': 'Location:',
-                'file': 'File:',
-                'execute_script': 'Execute Script',
-                'refresh_list': 'Refresh List',
-                'open_folder': 'Open Folder',
-                'close': 'Close',
-                'no_script_selected': 'No script selected',
-                'output': 'Output',
-                'console_output': 'Console Output',
-                'clear_output': 'Clear Output',
-                'warnings': 'Warnings',
-                'script_executed': 'Script executed successfully!',
-                'script_executed_warnings': 'Script executed with warnings',
-                'error_executing': 'Error executing script',
-                'scripts_reloaded': 'Scripts reloaded',
-                'browser_opened': 'Browser opened with',
-                'no_scripts_warning': 'No scripts found in folder',
-                'error_opening_folder': 'Error opening folder',
-                'output_captured': 'Output captured from script',
-                'about_title': 'Script Manager v1.0',
-                'about_subtitle': 'PyQGIS Script Management Plugin',
-                'about_description': 'The Script Manager plugin provides an intuitive interface for organizing and executing PyQGIS scripts within QGIS.',
-                'key_features': 'Key Features:',
-                'feature_browser': 'Script Browser with output capture and detailed error reporting',
-                'feature_quick': 'Quick Access menu with hover tooltips for fast script execution',
-                'feature_monitor': 'Auto-monitoring: Automatically detects new scripts and file changes',
-                'feature_management': 'Easy Management: Direct access to scripts folder and reload functionality',
-                'feature_safety': 'Safe Execution: Script validation and error handling',
-                'feature_output_capture': 'Output Capture: All print statements are captured and displayed',
-                'feature_crash_prevention': 'Crash Prevention: Safe execution environment with error handling',
-                'feature_script_validation': 'Script Validation: Pre-execution checks for security',
-                'scripts_location': 'Scripts Location:',
-                'currently_loaded': 'Currently loaded:',
-                'getting_started': 'Getting Started:',
-                'getting_started_1': '1. Click "Script Browser" to explore available scripts',
-                'getting_started_2': '2. Use "Quick Access" for fast script execution',
-                'getting_started_3': '3. Place your .py files in the scripts folder',
-                'getting_started_4': '4. Use "Reload Scripts" to refresh the list',
-                'getting_started_5': '5. Use print() statements in your scripts for output capture',
-                'script_format': 'Script Format Example:',
-                'error': 'Error',
-                'script_error': 'Script Error',
-                'validation_warnings': 'Script Validation Warnings',
-                'check_log': 'Check QGIS log for more details.',
-                'tooltip_browser': 'Open browser with detailed script descriptions and output capture',
-                'tooltip_reload': 'Reload all scripts from folder',
-                'tooltip_folder': 'Open the folder where scripts are stored',
-                'tooltip_about': 'Information about Script Manager'
-            },
-            
-            'pt_BR': {
-                'script_manager': 'Gerenciador de Scripts',
-                'script_browser': 'Navegador de Scripts',
-                'quick_access': 'Acesso Rápido',
-                'reload_scripts': 'Recarregar Scripts',
-                'open_scripts_folder': 'Abrir Pasta de Scripts',
-                'about': 'Sobre',
-                'no_scripts_found': 'Nenhum script encontrado',
-                'available_scripts': 'Scripts Disponíveis',
-                'scripts_found': 'scripts encontrados',
-                'scripts': 'Scripts:',
-                'select_script': 'Selecione um script',
-                'description': 'Descrição:',
-                'location': 'Localização:',
-                'file': 'Arquivo:',
-                'execute_script': 'Executar Script',
-                'refresh_list': 'Atualizar Lista',
-                'open_folder': 'Abrir Pasta',
-                'close': 'Fechar',
-                'no_script_selected': 'Nenhum script selecionado',
-                'output': 'Saída',
-                'console_output': 'Saída do Console',
-                'clear_output': 'Limpar Saída',
-                'warnings': 'Avisos',
-                'script_executed': 'Script executado com sucesso!',
-                'script_executed_warnings': 'Script executado com avisos',
-                'error_executing': 'Erro ao executar script',
-                'scripts_reloaded': 'Scripts recarregados',
-                'browser_opened': 'Navegador aberto com',
-                'no_scripts_warning': 'Nenhum script encontrado na pasta',
-                'error_opening_folder': 'Erro ao abrir pasta',
-                'output_captured': 'Saída capturada do script',
-                'about_title': 'Gerenciador de Scripts v1.0',
-                'about_subtitle': 'Plugin de Gerenciamento de Scripts PyQGIS',
-                'about_description': 'O plugin Gerenciador de Scripts fornece uma interface intuitiva para organizar e executar scripts PyQGIS dentro do QGIS.',
-                'key_features': 'Principais Recursos:',
-                'feature_browser': 'Navegador de Scripts com captura de saída e relatório detalhado de erros',
-                'feature_quick': 'Menu de Acesso Rápido com dicas ao passar o mouse para execução rápida',
-                'feature_monitor': 'Monitoramento Automático: Detecta automaticamente novos scripts e mudanças',
-                'feature_management': 'Gerenciamento Fácil: Acesso direto à pasta de scripts e funcionalidade de recarregamento',
-                'feature_safety': 'Execução Segura: Validação de script e tratamento de erros',
-                'feature_output_capture': 'Captura de Saída: Todas as mensagens print são capturadas e exibidas',
-                'feature_crash_prevention': 'Prevenção de Crashes: Ambiente de execução seguro com tratamento de erros',
-                'feature_script_validation': 'Validação de Scripts: Verificações pré-execução para segurança',
-                'scripts_location': 'Localização dos Scripts:',
-                'currently_loaded': 'Atualmente carregados:',
-                'getting_started': 'Como Começar:',
-                'getting_started_1': '1. Clique em "Navegador de Scripts" para explorar scripts disponíveis',
-                'getting_started_2': '2. Use "Acesso Rápido" para execução rápida de scripts',
-                'getting_started_3': '3. Coloque seus arquivos .py na pasta de scripts',
-                'getting_started_4': '4. Use "Recarregar Scripts" para atualizar a lista',
-                'getting_started_5': '5. Use comandos print() nos seus scripts para captura de saída',
-                'script_format': 'Exemplo de Formato de Script:',
-                'error': 'Erro',
-                'script_error': 'Erro no Script',
-                'validation_warnings': 'Avisos de Validação do Script',
-                'check_log': 'Verifique o log do QGIS para mais detalhes.',
-                'tooltip_browser': 'Abrir navegador com descrições detalhadas dos scripts e captura de saída',
-                'tooltip_reload': 'Recarregar todos os scripts da pasta',
-                'tooltip_folder': 'Abrir a pasta onde os scripts são armazenados',
-                'tooltip_about': 'Informações sobre o Gerenciador de Scripts'
-            }
+            'menu_title': f"📋 {t['script_manager']}",
+            'menu_browser': f"🔍 {t['script_browser']}",
+            'menu_no_scripts': f"❌ {t['no_scripts_found']}",
+            'menu_loading': f"⏳ {t['loading_scripts']}",
+            'menu_quick_access': f"⚡ {t['quick_access']}",
+            'menu_reload': f"🔄 {t['reload_scripts']}",
+            'menu_open_folder': f"📁 {t['open_scripts_folder']}",
+            'menu_about': f"ℹ️ {t['about']}",
+            'browser_title': f"📋 {t['script_browser']}",
+            'available_scripts': f"📚 {t['available_scripts']}",
+            'scripts_label': f"{t['scripts']}:",
+            'description_label': f"{t['description']}:",
+            'location_label': f"{t['location']}:",
+            'description_tab': f"📝 {t['description']}",
+            'clear_output': f"🗑️ {t['clear_output']}",
+            'console_output_label': f"{t['console_output']}:",
+            'output_tab': f"📺 {t['output']}",
+            'execute_script': f"▶️ {t['execute_script']}",
+            'refresh_list': f"🔄 {t['refresh_list']}",
+            'open_folder': f"📁 {t['open_folder']}",
+            'close': f"❌ {t['close']}",
+            'file_prefix': f"{t['file']}: ",
+            'script_executed_bare': t['script_executed'].replace('!', ''),
         }
     
     def tr(self, key, fallback=None):
-        if fallback is None:
-            fallback = key
-        
-        if self.current_language in self.translations:
-            return self.translations[self.current_language].get(key, fallback)
-        
-        if 'en' in self.translations:
-            return self.translations['en'].get(key, fallback)
-        
-        return fallback
+        return self._active.get(key, key if fallback is None else fallback)
+
 
+_translator = None
 
-_translator = Translator()
+def get_translator():
+    """Return the shared Translator, creating it on first use"""
+    global _translator
+    if _translator is None:
+        _translator = Translator()
+    return _translator
 
 def tr(key, fallback=None):
-    return _translator.tr(key, fallback)
+    return get_translator().tr(key, fallback)
 
 
 class ScriptWatcher(QObject):
@@ -376,43 +626,99 @@ class ScriptWatcher(QObject):
     
     scripts_changed = pyqtSignal()
     
-    def __init__(self, scripts_path):
+    def __init__(self, scripts_path, poll_interval_ms=None):
         super().__init__()
         self.scripts_path = scripts_path
-        self.watcher = QFileSystemWatcher()
+        self.watcher = QFileSystemWatcher(self)
         self.watcher.directoryChanged.connect(self.on_directory_changed)
-        self.watcher.fileChanged.connect(self.on_file_changed)
         
-        if os.path.exists(scripts_path):
-            self.watcher.addPath(scripts_path)
+        # Editors fire several events per save; emit once per burst
+        self._coalesce = QTimer(self)
+        self._coalesce.setSingleShot(True)
+        self._coalesce.setInterval(150)
+        self._coalesce.timeout.connect(self.scripts_changed.emit)
+        
+        # addPath simply returns False when the folder does not exist yet
+        self.watcher.addPath(scripts_path)
+        
+        # Network shares can drop native events; a periodic rescan is cheap
+        # because unchanged folders are detected before any script is reread
+        self._poll_timer = None
+        if poll_interval_ms:
+            self._poll_timer = QTimer(self)
+            self._poll_timer.timeout.connect(self.scripts_changed.emit)
+            self._poll_timer.start(poll_interval_ms)
     
     def on_directory_changed(self, path):
-        self.scripts_changed.emit()
+        self._coalesce.start()
     
-    def on_file_changed(self, path):
-        if os.path.exists(path) and path not in self.watcher.files():
-            self.watcher.addPath(path)
-        self.scripts_changed.emit()
-    
-    def add_file_to_watch(self, file_path):
-        if os.path.exists(file_path) and file_path not in self.watcher.files():
-            self.watcher.addPath(file_path)
+    def stop(self):
+        """Stop watching and polling; no scripts_changed is emitted afterwards"""
+        self._coalesce.stop()
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+        self.watcher.directoryChanged.disconnect(self.on_directory_changed)
+        paths = self.watcher.directories()
+        if paths:
+            self.watcher.removePaths(paths)
 
 
 class ScriptBrowserDialog(QDialog):
     """Enhanced script browser with output capture and error handling"""
     
-    def __init__(self, scripts_info, execute_callback, parent=None, refresh_callback=None):
+    # Line kinds for append_output_batch, indexing _OUT_PREFIXES
+    _OUT_INFO, _OUT_ERROR, _OUT_WARNING = range(3)
+    _OUT_PREFIXES = ("[{}] ", "[{}] ❌ ", "[{}] ⚠️  ")
+    
+    _DESC_CSS = """
+        QTextEdit {
+            background-color: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 4px;
+            padding: 8px;
+            font-size: 11px;
+        }
+    """
+    _OUTPUT_CSS = """
+        QPlainTextEdit {
+            background-color: #1e1e1e;
+            color: #ffffff;
+            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+            font-size: 10px;
+            border: 1px solid #555;
+            border-radius: 4px;
+        }
+    """
+    _RUN_BUTTON_CSS = """
+        QPushButton {
+            background-color: #28a745;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #218838;
+        }
+        QPushButton:disabled {
+            background-color: #6c757d;
+        }
+    """
+    
+    def __init__(self, scripts_info, execute_callback, parent=None, refresh_callback=None,
+                 sorted_scripts=None):
         super().__init__(parent)
         self.scripts_info = scripts_info
+        self._sorted_scripts = sorted_scripts
         self.execute_callback = execute_callback
         self.refresh_callback = refresh_callback
         self.current_script = None
-        self.executor = SafeScriptExecutor()
         self.setup_ui()
     
     def setup_ui(self):
-        self.setWindowTitle(f"📋 {tr('script_browser')}")
+        labels = get_translator().labels
+        self.setWindowTitle(labels['browser_title'])
         self.setModal(False)
         self.resize(900, 600)
         
@@ -422,15 +728,15 @@ class ScriptBrowserDialog(QDialog):
         header_layout.setSpacing(8)
         header_layout.setContentsMargins(0, 5, 0, 5)
         
-        title = QLabel(f"📚 {tr('available_scripts')}")
-        title.setFont(QFont("", 11, QtCompat.get_font_weight_bold()))
+        title = QLabel(labels['available_scripts'])
+        title.setFont(_FONT_BOLD_11)
         title.setStyleSheet("color: #2E86AB; margin: 0px; padding: 0px;")
         
-        count_label = QLabel(f"({len(self.scripts_info)} {tr('scripts_found')})")
-        count_label.setStyleSheet("color: #666; font-style: italic; margin: 0px; padding: 0px;")
+        self.count_label = QLabel(f"({len(self.scripts_info)} {tr('scripts_found')})")
+        self.count_label.setStyleSheet("color: #666; font-style: italic; margin: 0px; padding: 0px;")
         
         header_layout.addWidget(title)
-        header_layout.addWidget(count_label)
+        header_layout.addWidget(self.count_label)
         header_layout.addStretch()
         
         header_widget = QWidget()
@@ -439,23 +745,20 @@ class ScriptBrowserDialog(QDialog):
         
         layout.addWidget(header_widget)
         
-        splitter = QSplitter(QtCompat.get_horizontal())
+        splitter = QSplitter(HORIZONTAL)
         
         # Left panel - Script list
         list_widget = QWidget()
         list_layout = QVBoxLayout()
         
-        list_label = QLabel(f"{tr('scripts')}:")
-        list_label.setFont(QFont("", 9, QtCompat.get_font_weight_bold()))
+        list_label = QLabel(labels['scripts_label'])
+        list_label.setFont(_FONT_BOLD_9)
         list_layout.addWidget(list_label)
         
         self.script_list = QListWidget()
         self.script_list.setMaximumWidth(280)
         
-        for filename, script_info in sorted(self.scripts_info.items()):
-            item = QListWidgetItem(f"📄 {script_info['name']}")
-            item.setData(QtCompat.get_user_role(), (filename, script_info))
-            self.script_list.addItem(item)
+        self.populate_script_list()
         
         self.script_list.currentItemChanged.connect(self.on_script_selected)
         list_layout.addWidget(self.script_list)
@@ -467,7 +770,7 @@ class ScriptBrowserDialog(QDialog):
         details_layout = QVBoxLayout()
         
         self.script_name = QLabel(tr('select_script'))
-        self.script_name.setFont(QFont("", 12, QtCompat.get_font_weight_bold()))
+        self.script_name.setFont(_FONT_BOLD_12)
         self.script_name.setStyleSheet("color: #2E86AB; margin-bottom: 10px;")
         
         self.script_filename = QLabel("")
@@ -482,24 +785,16 @@ class ScriptBrowserDialog(QDialog):
         desc_tab = QWidget()
         desc_layout = QVBoxLayout()
         
-        desc_label = QLabel(f"{tr('description')}:")
-        desc_label.setFont(QFont("", 9, QtCompat.get_font_weight_bold()))
+        desc_label = QLabel(labels['description_label'])
+        desc_label.setFont(_FONT_BOLD_9)
         
         self.script_description = QTextEdit()
         self.script_description.setReadOnly(True)
         self.script_description.setMaximumHeight(120)
-        self.script_description.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-        """)
+        self.script_description.setStyleSheet(self._DESC_CSS)
         
-        path_label = QLabel(f"{tr('location')}:")
-        path_label.setFont(QFont("", 9, QtCompat.get_font_weight_bold()))
+        path_label = QLabel(labels['location_label'])
+        path_label.setFont(_FONT_BOLD_9)
         
         self.script_path = QLabel("")
         self.script_path.setWordWrap(True)
@@ -512,7 +807,7 @@ class ScriptBrowserDialog(QDialog):
         desc_layout.addStretch()
         
         desc_tab.setLayout(desc_layout)
-        self.tab_widget.addTab(desc_tab, f"📝 {tr('description')}")
+        self.tab_widget.addTab(desc_tab, labels['description_tab'])
         
         # Output tab
         output_tab = QWidget()
@@ -520,11 +815,11 @@ class ScriptBrowserDialog(QDialog):
         
         output_controls = QHBoxLayout()
         
-        clear_output_btn = QPushButton(f"🗑️ {tr('clear_output')}")
+        clear_output_btn = QPushButton(labels['clear_output'])
         clear_output_btn.clicked.connect(self.clear_output)
         clear_output_btn.setMaximumWidth(120)
         
-        output_controls.addWidget(QLabel(f"{tr('console_output')}:"))
+        output_controls.addWidget(QLabel(labels['console_output_label']))
         output_controls.addStretch()
         output_controls.addWidget(clear_output_btn)
         
@@ -532,43 +827,19 @@ class ScriptBrowserDialog(QDialog):
         
         self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
-        self.output_text.setStyleSheet("""
-            QPlainTextEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 10px;
-                border: 1px solid #555;
-                border-radius: 4px;
-            }
-        """)
+        self.output_text.setStyleSheet(self._OUTPUT_CSS)
         self.output_text.setPlainText("Console output will appear here after script execution...")
         
         output_layout.addWidget(self.output_text)
         output_tab.setLayout(output_layout)
-        self.tab_widget.addTab(output_tab, f"📺 {tr('output')}")
+        self.tab_widget.addTab(output_tab, labels['output_tab'])
         
         details_layout.addWidget(self.tab_widget)
         
-        self.run_button = QPushButton(f"▶️ {tr('execute_script')}")
+        self.run_button = QPushButton(labels['execute_script'])
         self.run_button.setEnabled(False)
         self.run_button.clicked.connect(self.run_selected_script)
-        self.run_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        self.run_button.setStyleSheet(self._RUN_BUTTON_CSS)
         
         details_layout.addWidget(self.run_button)
         
@@ -581,13 +852,13 @@ class ScriptBrowserDialog(QDialog):
         # Bottom button panel
         button_layout = QHBoxLayout()
         
-        refresh_btn = QPushButton(f"🔄 {tr('refresh_list')}")
+        refresh_btn = QPushButton(labels['refresh_list'])
         refresh_btn.clicked.connect(self.refresh_scripts)
         
-        open_folder_btn = QPushButton(f"📁 {tr('open_folder')}")
+        open_folder_btn = QPushButton(labels['open_folder'])
         open_folder_btn.clicked.connect(self.open_scripts_folder)
         
-        close_btn = QPushButton(f"❌ {tr('close')}")
+        close_btn = QPushButton(labels['close'])
         close_btn.clicked.connect(self.accept)
         
         button_layout.addWidget(refresh_btn)
@@ -601,11 +872,83 @@ class ScriptBrowserDialog(QDialog):
         if self.script_list.count() > 0:
             self.script_list.setCurrentRow(0)
     
+    def sorted_scripts(self):
+        """Return the scripts sorted by filename, using the caller's pre-sorted items if given"""
+        if self._sorted_scripts is None:
+            self._sorted_scripts = tuple(sorted(self.scripts_info.items(), key=itemgetter(0)))
+        return self._sorted_scripts
+    
+    def populate_script_list(self):
+        with self._batch_list_update():
+            self.script_list.clear()
+            sorted_scripts = self.sorted_scripts()
+            self._listed = dict(sorted_scripts)
+            self._listed_names = [filename for filename, _ in sorted_scripts]
+            script_list = self.script_list
+            make_item = self._make_item
+            for filename, script_info in sorted_scripts:
+                # Passing the list as parent appends the item without an addItem call
+                make_item(filename, script_info, script_list)
+    
+    @contextlib.contextmanager
+    def _batch_list_update(self):
+        """Suspend repaints and selection signals while the list is rebuilt"""
+        self.script_list.setUpdatesEnabled(False)
+        self.script_list.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.script_list.blockSignals(False)
+            self.script_list.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def _item_text(script_info):
+        return f"📄 {script_info['name']}"
+    
+    def _make_item(self, filename, script_info, parent=None):
+        """Build the list item for a script; the only place item data is set"""
+        item = QListWidgetItem(self._item_text(script_info), parent)
+        item.setData(USER_ROLE, filename)
+        return item
+    
+    def sync_scripts(self, new_info):
+        """Apply only the added, removed and changed scripts to the list"""
+        old_keys = self._listed.keys()
+        new_keys = new_info.keys()
+        removed = old_keys - new_keys
+        added = new_keys - old_keys
+        changed = {k for k in old_keys & new_keys if new_info[k] != self._listed[k]}
+        
+        with self._batch_list_update():
+            for filename in removed:
+                row = bisect.bisect_left(self._listed_names, filename)
+                self.script_list.takeItem(row)
+                del self._listed_names[row]
+                del self._listed[filename]
+            
+            for filename in changed:
+                script_info = new_info[filename]
+                item = self.script_list.item(bisect.bisect_left(self._listed_names, filename))
+                item.setText(self._item_text(script_info))
+                self._listed[filename] = script_info
+            
+            for filename in sorted(added):
+                row = bisect.bisect_left(self._listed_names, filename)
+                self._listed[filename] = new_info[filename]
+                self._listed_names.insert(row, filename)
+                self.script_list.insertItem(row, self._make_item(filename, new_info[filename]))
+        
+        self.scripts_info = new_info
+        self._sorted_scripts = None
+        self.count_label.setText(f"({len(self._listed)} {tr('scripts_found')})")
+        return bool(removed or added or changed)
+    
     def on_script_selected(self, current, previous):
         if current:
-            filename, script_info = current.data(QtCompat.get_user_role())
+            filename = current.data(USER_ROLE)
+            script_info = self._listed[filename]
             self.script_name.setText(script_info['name'])
-            self.script_filename.setText(f"{tr('file')}: {filename}")
+            self.script_filename.setText(get_translator().labels['file_prefix'] + filename)
             self.script_description.setText(script_info['description'])
             self.script_path.setText(script_info['path'])
             self.run_button.setEnabled(True)
@@ -625,9 +968,14 @@ class ScriptBrowserDialog(QDialog):
         self.tab_widget.setCurrentIndex(1)
         self.clear_output()
         
-        self.append_output(f"🚀 Executing: {self.current_script['name']}")
-        self.append_output(f"📁 Path: {self.current_script['path']}")
-        self.append_output("=" * 60)
+        self.append_output_batch((
+            (f"🚀 Executing: {self.current_script['name']}", self._OUT_INFO),
+            (f"📁 Path: {self.current_script['path']}", self._OUT_INFO),
+            ("=" * 60, self._OUT_INFO),
+        ))
+        
+        # Paint the header once before the script blocks the event loop
+        QApplication.processEvents()
         
         try:
             success, output, errors, warnings = self.execute_callback(
@@ -635,39 +983,44 @@ class ScriptBrowserDialog(QDialog):
                 capture_output=True
             )
             
+            lines = []
             if output:
-                self.append_output("📤 Script Output:")
-                self.append_output(output)
-                self.append_output("-" * 40)
+                lines += (("📤 Script Output:", self._OUT_INFO),
+                          (output, self._OUT_INFO),
+                          ("-" * 40, self._OUT_INFO))
             
             if errors:
-                self.append_output("❌ Script Errors:")
-                self.append_output(errors, is_error=True)
-                self.append_output("-" * 40)
+                lines += (("❌ Script Errors:", self._OUT_INFO),
+                          (errors, self._OUT_ERROR),
+                          ("-" * 40, self._OUT_INFO))
             
             if warnings:
-                self.append_output("⚠️ Validation Warnings:")
-                for warning in warnings:
-                    self.append_output(warning, is_warning=True)
-                self.append_output("-" * 40)
+                lines.append(("⚠️ Validation Warnings:", self._OUT_INFO))
+                lines += ((warning, self._OUT_WARNING) for warning in warnings)
+                lines.append(("-" * 40, self._OUT_INFO))
+            
+            if not success:
+                lines.append(("❌ Script execution failed!", self._OUT_INFO))
+            elif warnings:
+                lines.append(("✅ Script executed successfully with warnings!", self._OUT_INFO))
+            else:
+                lines.append(("✅ Script executed successfully!", self._OUT_INFO))
+            
+            self.append_output_batch(lines)
             
             if success:
                 if warnings:
-                    self.append_output("✅ Script executed successfully with warnings!")
                     iface.messageBar().pushMessage(
                         tr('script_manager'), 
                         f"⚠️ {tr('script_executed_warnings')}: '{self.current_script['name']}'",
                         level=1, duration=3
                     )
                 else:
-                    self.append_output("✅ Script executed successfully!")
                     iface.messageBar().pushMessage(
                         tr('script_manager'), 
-                        f"✅ {tr('script_executed').replace('!', '')} '{self.current_script['name']}'!",
+                        f"✅ {get_translator().labels['script_executed_bare']} '{self.current_script['name']}'!",
                         level=3, duration=3
                     )
-            else:
-                self.append_output("❌ Script execution failed!")
                 
         except Exception as e:
             self.append_output(f"💥 Critical Error: {str(e)}", is_error=True)
@@ -676,26 +1029,19 @@ class ScriptBrowserDialog(QDialog):
             )
     
     def append_output(self, text, is_error=False, is_warning=False):
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        from datetime import datetime
+        kind = self._OUT_ERROR if is_error else self._OUT_WARNING if is_warning else self._OUT_INFO
+        self.append_output_batch(((text, kind),))
+    
+    def append_output_batch(self, lines):
+        """Append (text, kind) pairs as one block sharing a single timestamp"""
         timestamp = datetime.now().strftime("%H:%M:%S")
+        prefixes = [prefix.format(timestamp) for prefix in self._OUT_PREFIXES]
         
-        if is_error:
-            formatted_text = f"[{timestamp}] ❌ {text}"
-        elif is_warning:
-            formatted_text = f"[{timestamp}] ⚠️  {text}"
-        else:
-            formatted_text = f"[{timestamp}] {text}"
-        
-        cursor.insertText(formatted_text + "\n")
-        self.output_text.setTextCursor(cursor)
+        # appendPlainText moves to the end itself; one call for the whole block
+        self.output_text.appendPlainText("\n".join(prefixes[kind] + text for text, kind in lines))
         
         scrollbar = self.output_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
-        
-        QApplication.processEvents()
     
     def clear_output(self):
         self.output_text.clear()
@@ -705,59 +1051,51 @@ class ScriptBrowserDialog(QDialog):
         """Recarrega a lista de scripts sem fechar o diálogo."""
         if self.refresh_callback:
             updated_scripts = self.refresh_callback()
-            self.scripts_info = updated_scripts
+        else:
+            updated_scripts = self.scripts_info
 
-        self.script_list.clear()
-        for filename, script_info in sorted(self.scripts_info.items()):
-            item = QListWidgetItem(f"📄 {script_info['name']}")
-            item.setData(QtCompat.get_user_role(), (filename, script_info))
-            self.script_list.addItem(item)
+        if not self.sync_scripts(updated_scripts):
+            return
 
-        if self.script_list.count() > 0:
+        if self.script_list.currentItem() is None and self.script_list.count() > 0:
             self.script_list.setCurrentRow(0)
         else:
-            self.on_script_selected(None, None)
+            self.on_script_selected(self.script_list.currentItem(), None)
     
     def open_scripts_folder(self):
-        import subprocess
-        import platform
-        
         try:
             scripts_dir = os.path.dirname(self.current_script['path']) if self.current_script else ""
             if scripts_dir and os.path.exists(scripts_dir):
-                if platform.system() == "Windows":
-                    os.startfile(scripts_dir)
-                elif platform.system() == "Darwin":
-                    subprocess.run(["open", scripts_dir])
-                else:
-                    subprocess.run(["xdg-open", scripts_dir])
+                _OPEN_FOLDER(scripts_dir)
         except Exception as e:
             QMessageBox.information(self, tr('open_scripts_folder'), f"{tr('error_opening_folder')}: {str(e)}")
 
 
-def show_status_message(message, timeout=3000, is_warning=False):
-    """Display a temporary message in the QGIS status bar"""
-    try:
-        status_bar = iface.mainWindow().statusBar()
-        
-        if is_warning:
-            status_bar.setStyleSheet("QStatusBar { background-color: #FFF3CD; color: #856404; }")
-        else:
-            status_bar.setStyleSheet("QStatusBar { background-color: #D4EDDA; color: #155724; }")
-        
-        status_bar.showMessage(message, timeout)
-        
-        def restore_style():
-            status_bar.setStyleSheet("")
-        
-        QTimer.singleShot(timeout, restore_style)
-        
-    except Exception:
-        iface.messageBar().pushMessage(
-            tr('script_manager'), message, 
-            level=1 if is_warning else 0,
-            duration=timeout // 1000
-        )
+class _ScanSignals(QObject):
+    finished = pyqtSignal(object)
+
+
+class _ScriptScanWorker(QRunnable):
+    """Runs a folder scan on a QThreadPool thread and reports the result by signal"""
+    
+    def __init__(self, scan):
+        super().__init__()
+        self.scan = scan
+        # Created on the GUI thread, so connected slots run there
+        self.signals = _ScanSignals()
+    
+    def run(self):
+        try:
+            result = self.scan()
+        except Exception as e:
+            QgsMessageLog.logMessage(f"Error scanning scripts: {str(e)}", 
+                                   "Script Manager", Qgis.Critical)
+            result = None
+        self.signals.finished.emit(result)
+
+
+_CSS_STATUS_OK = "QStatusBar { background-color: #D4EDDA; color: #155724; }"
+_CSS_STATUS_WARN = "QStatusBar { background-color: #FFF3CD; color: #856404; }"
 
 
 class ScriptManager:
@@ -767,35 +1105,90 @@ class ScriptManager:
         self.iface = iface
         self.plugin_dir = os.path.dirname(__file__)
         self.scripts_dir = os.path.join(self.plugin_dir, 'scripts')
+        # Kept outside the watched scripts folder so writing it does not trigger a reload
+        self._meta_cache_path = os.path.join(self.plugin_dir, '.script_manager_cache.json')
+        self._meta_cache = None
         
         if not os.path.exists(self.scripts_dir):
             os.makedirs(self.scripts_dir)
             self.create_example_script()
         
         self.menu = None
-        self.actions = []
+        self.quick_menu = None
+        self.no_scripts_action = None
+        self._action_by_name = {}
+        self._action_names = []
+        self._quick_menu_dirty = True
         self.scripts = {}
+        self.sorted_scripts = ()
+        # (name, mtime_ns, size) of every script at the last applied scan
+        self._scan_signature = None
+        self._scan_lock = threading.Lock()
+        self._scan_generation = 0
+        self._applied_generation = 0
+        self._scan_worker = None
+        self._scan_running = False
+        self._queued_scan_callback = None
         self.browser_dialog = None
-        self.executor = SafeScriptExecutor()
+        self._about_dialog = None
+        self._about_label = None
+        self._about_html = None
+        self.executor = get_executor()
         
-        self.watcher = ScriptWatcher(self.scripts_dir)
+        poll_interval = _NETWORK_POLL_INTERVAL if _is_network_fs(self.scripts_dir) else None
+        self.watcher = ScriptWatcher(self.scripts_dir, poll_interval)
         self.watcher.scripts_changed.connect(self.reload_scripts)
         
-        self.reload_timer = QTimer()
-        self.reload_timer.setSingleShot(True)
-        self.reload_timer.timeout.connect(self.update_menu)
+        self._reload_pending = False
+        self._reload_requested = False
+        self._last_reload = float('-inf')
+        
+        self._status_style = ""
+        self._status_clear_timer = QTimer()
+        self._status_clear_timer.setSingleShot(True)
+        self._status_clear_timer.timeout.connect(self._clear_status_style)
         
         QgsMessageLog.logMessage(f"Script Manager initialized with Qt{QT_VERSION}", 
                                 "Script Manager", Qgis.Info)
         
+    def show_status_message(self, message, timeout=3000, is_warning=False):
+        """Display a temporary message in the QGIS status bar"""
+        try:
+            status_bar = self.iface.mainWindow().statusBar()
+            style = _CSS_STATUS_WARN if is_warning else _CSS_STATUS_OK
+            # Restyling repolishes the whole status bar; skip it while hovering across scripts
+            if style != self._status_style:
+                status_bar.setStyleSheet(style)
+                self._status_style = style
+            status_bar.showMessage(message, timeout)
+            
+            self._status_clear_timer.start(timeout)
+            
+        except Exception:
+            self.iface.messageBar().pushMessage(
+                tr('script_manager'), message, 
+                level=1 if is_warning else 0,
+                duration=timeout // 1000
+            )
+    
+    def _clear_status_style(self):
+        self._status_style = ""
+        try:
+            self.iface.mainWindow().statusBar().setStyleSheet("")
+        except Exception:
+            pass
+    
     def initGui(self):
         try:
-            self.menu = QMenu(f"📋 {tr('script_manager')}", self.iface.mainWindow().menuBar())
+            labels = get_translator().labels
+            self.menu = QMenu(labels['menu_title'], self.iface.mainWindow().menuBar())
             menubar = self.iface.mainWindow().menuBar()
             menubar.addMenu(self.menu)
             
-            self.load_scripts()
+            # Show the menu straight away; scripts are read off the GUI thread
             self.create_menu()
+            self.no_scripts_action.setText(labels['menu_loading'])
+            self.load_scripts_async(self._apply_initial_scan)
             
         except Exception as e:
             QgsMessageLog.logMessage(f"Error initializing GUI: {str(e)}", 
@@ -803,14 +1196,38 @@ class ScriptManager:
             QMessageBox.critical(None, "Script Manager Error", 
                                f"Failed to initialize plugin GUI:\n{str(e)}")
     
+    def _apply_initial_scan(self, scan):
+        self.no_scripts_action.setText(get_translator().labels['menu_no_scripts'])
+        self.apply_scan(scan)
+        self.create_menu()
+    
     def unload(self):
         try:
             if self.browser_dialog:
                 self.browser_dialog.close()
+                self.browser_dialog.deleteLater()
+                self.browser_dialog = None
+            if self._about_dialog:
+                self._about_dialog.deleteLater()
+                self._about_dialog = None
             if self.menu:
-                self.menu.clear()
                 self.iface.mainWindow().menuBar().removeAction(self.menu.menuAction())
-            self.actions.clear()
+                # Deleting the menu takes every child action and the quick access submenu with it
+                self.menu.deleteLater()
+                # A scan still running in the pool sees this and drops its result
+                self.menu = None
+            if self.watcher:
+                # Otherwise a queued poll could still start a scan that rewrites the cache file
+                self.watcher.scripts_changed.disconnect(self.reload_scripts)
+                self.watcher.stop()
+                self.watcher.deleteLater()
+                self.watcher = None
+            self._queued_scan_callback = None
+            self._action_by_name.clear()
+            self._action_names.clear()
+            self.quick_menu = None
+            self.no_scripts_action = None
+            self._status_clear_timer.stop()
             QgsMessageLog.logMessage("Script Manager unloaded successfully", 
                                    "Script Manager", Qgis.Info)
         except Exception as e:
@@ -818,7 +1235,7 @@ class ScriptManager:
                                    "Script Manager", Qgis.Warning)
     
     def create_example_script(self):
-        lang = _translator.current_language
+        lang = get_translator().current_language
         
         qt_import_template = '''# -*- coding: utf-8 -*-
 """
@@ -931,73 +1348,165 @@ if __name__ == "__main__":
     main()
 '''
         
+        # Exclusive binary create: one encode, no newline translation, never overwrites a user's file
         example_path = os.path.join(self.scripts_dir, 'layers_example.py')
-        with open(example_path, 'w', encoding='utf-8') as f:
-            f.write(example_script)
+        try:
+            with open(example_path, 'xb') as f:
+                f.write(example_script.encode('utf-8'))
+        except FileExistsError:
+            pass
     
     def load_scripts(self):
-        self.scripts.clear()
-        
-        if not os.path.exists(self.scripts_dir):
+        """Rescan the scripts folder; returns False when nothing changed since the last scan"""
+        return self.apply_scan(self.scan_scripts())
+    
+    def load_scripts_async(self, callback):
+        """Scan on a pool thread and pass the result to callback on the GUI thread"""
+        if self._scan_running:
+            # One scan at a time; the latest request runs when the current one ends
+            self._queued_scan_callback = callback
             return
-        
-        loaded_count = 0
-        error_count = 0
-        
-        for filename in os.listdir(self.scripts_dir):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                script_path = os.path.join(self.scripts_dir, filename)
-                try:
-                    script_info = self.get_script_info(script_path)
-                    if script_info:
-                        self.scripts[filename] = script_info
-                        self.watcher.add_file_to_watch(script_path)
-                        loaded_count += 1
-                    else:
-                        error_count += 1
-                except Exception as e:
-                    error_count += 1
-                    QgsMessageLog.logMessage(f"Error loading script {filename}: {str(e)}", 
-                                           "Script Manager", Qgis.Warning)
-        
-        QgsMessageLog.logMessage(f"Loaded {loaded_count} scripts, {error_count} errors", 
-                               "Script Manager", Qgis.Info)
+        self._scan_running = True
+        # Keep a reference: the worker's signals object must outlive the queued delivery
+        self._scan_worker = _ScriptScanWorker(self.scan_scripts)
+        self._scan_worker.setAutoDelete(False)
+        self._scan_worker.signals.finished.connect(
+            lambda scan: self._on_scan_finished(scan, callback))
+        QThreadPool.globalInstance().start(self._scan_worker)
     
-    def get_script_info(self, script_path):
-        try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+    def _on_scan_finished(self, scan, callback):
+        self._scan_running = False
+        if self.menu is None:
+            return
+        callback(scan)
+        if self._queued_scan_callback is not None:
+            callback, self._queued_scan_callback = self._queued_scan_callback, None
+            self.load_scripts_async(callback)
+    
+    def scan_scripts(self):
+        """Read the scripts folder without touching Qt; returns None when it is unchanged
+        
+        Safe to call from a worker thread: scans are serialized and results are
+        only published by apply_scan on the GUI thread.
+        """
+        with self._scan_lock:
             try:
-                compile(content, script_path, 'exec')
-            except SyntaxError as e:
-                QgsMessageLog.logMessage(f"Syntax error in {script_path}: {str(e)}", 
-                                       "Script Manager", Qgis.Warning)
+                # Filter while iterating; the context manager closes the directory handle promptly
+                with os.scandir(self.scripts_dir) as entries:
+                    candidates = [
+                        entry for entry in entries
+                        if entry.name.endswith('.py') and not entry.name.startswith('__') and entry.is_file()
+                    ]
+            except OSError:
+                candidates = []
+            
+            stats = [entry.stat() for entry in candidates]
+            signature = frozenset((entry.name, st.st_mtime_ns, st.st_size)
+                                  for entry, st in zip(candidates, stats))
+            if signature == self._scan_signature:
                 return None
             
-            description = "PyQGIS Script"
+            meta_cache = self.load_meta_cache()
+            cache_dirty = False
+            infos = {}
+            to_parse = []
+            
+            for entry, st in zip(candidates, stats):
+                cached = meta_cache.get(entry.name)
+                if (isinstance(cached, dict) and cached.get('mtime_ns') == st.st_mtime_ns
+                        and cached.get('size') == st.st_size):
+                    infos[entry.name] = {
+                        'name': cached['name'],
+                        'path': entry.path,
+                        'description': cached['description'],
+                    }
+                else:
+                    to_parse.append((entry, st))
+            
+            # Reading scripts is I/O bound; overlap the reads when there are enough of them
+            paths = [entry.path for entry, _ in to_parse]
+            if len(paths) < _PARALLEL_LOAD_THRESHOLD:
+                parsed = [self.get_script_info(path) for path in paths]
+            else:
+                workers = min(32, (os.cpu_count() or 1) * 4)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    parsed = list(pool.map(self.get_script_info, paths))
+            
+            for (entry, st), script_info in zip(to_parse, parsed):
+                infos[entry.name] = script_info
+                if script_info:
+                    meta_cache[entry.name] = {
+                        'mtime_ns': st.st_mtime_ns,
+                        'size': st.st_size,
+                        'name': script_info['name'],
+                        'description': script_info['description'],
+                    }
+                    cache_dirty = True
             
-            import re
+            for stale in meta_cache.keys() - infos.keys():
+                del meta_cache[stale]
+                cache_dirty = True
             
-            patterns = [
-                r'"""[\s\S]*?Description:\s*([^\n]+)',
-                r"'''[\s\S]*?Description:\s*([^\n]+)",
-                r'Description:\s*(.+)',
-                r'"""[\s\S]*?Descrição:\s*([^\n]+)',
-                r"'''[\s\S]*?Descrição:\s*([^\n]+)",
-                r'Descrição:\s*(.+)',
-                r'"""[\s\S]*?Descripción:\s*([^\n]+)',
-                r"'''[\s\S]*?Descripción:\s*([^\n]+)",
-                r'Descripción:\s*(.+)',
-            ]
+            if cache_dirty:
+                self.save_meta_cache()
             
-            for pattern in patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    description = match.group(1).strip()
-                    break
+            self._scan_generation += 1
+            return {
+                'generation': self._scan_generation,
+                'signature': signature,
+                'scripts': {name: info for name, info in infos.items() if info},
+                'paths': {entry.path for entry in candidates},
+                'errors': sum(1 for info in infos.values() if not info),
+            }
+    
+    def apply_scan(self, scan):
+        """Publish a scan_scripts result; returns False when it brings nothing new"""
+        if scan is None or scan['generation'] <= self._applied_generation:
+            return False
+        self._applied_generation = scan['generation']
+        self._scan_signature = scan['signature']
+        
+        # Keep the same dict object; the script browser holds a reference to it
+        self.scripts.clear()
+        self.scripts.update(scan['scripts'])
+        self.sorted_scripts = tuple(sorted(self.scripts.items(), key=itemgetter(0)))
+        self.executor.forget_missing(scan['paths'])
+        
+        QgsMessageLog.logMessage(f"Loaded {len(self.scripts)} scripts, {scan['errors']} errors", 
+                               "Script Manager", Qgis.Info)
+        return True
+    
+    def load_meta_cache(self):
+        """Return the on-disk metadata cache, reading it only once per session"""
+        if self._meta_cache is None:
+            try:
+                with open(self._meta_cache_path, 'r', encoding='utf-8') as f:
+                    self._meta_cache = json.load(f)
+            except (OSError, ValueError):
+                self._meta_cache = {}
+            if not isinstance(self._meta_cache, dict):
+                self._meta_cache = {}
+        return self._meta_cache
+    
+    def save_meta_cache(self):
+        try:
+            with open(self._meta_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._meta_cache, f)
+        except OSError as e:
+            QgsMessageLog.logMessage(f"Could not write script cache: {str(e)}", 
+                                   "Script Manager", Qgis.Warning)
+    
+    def get_script_info(self, script_path):
+        try:
+            # Only the header docstring is needed; syntax errors surface when the script runs
+            # A stray non-UTF-8 byte should not hide the script from the menu
+            with open(script_path, 'r', encoding='utf-8', errors='replace') as f:
+                header = f.read(_HEADER_SIZE)
+                description = _find_description(header)
+                if description is None and _has_open_docstring(header):
+                    description = _find_description(header + f.read(_HEADER_EXTENSION))
             
-            description = description.replace('"', '').replace("'", "").strip()
+            description = (description or "").translate(_QUOTE_STRIP).strip()
             if not description:
                 description = "PyQGIS Script"
             
@@ -1008,7 +1517,6 @@ if __name__ == "__main__":
                 'name': display_name,
                 'path': script_path,
                 'description': description,
-                'content': content
             }
         
         except Exception as e:
@@ -1020,84 +1528,156 @@ if __name__ == "__main__":
         if not self.menu:
             return
         
+        self.menu.blockSignals(True)
         try:
-            self.menu.clear()
-            self.actions.clear()
-            
-            browser_action = QAction(f"🔍 {tr('script_browser')}", self.iface.mainWindow())
-            browser_action.setToolTip(tr('tooltip_browser'))
-            browser_action.triggered.connect(self.open_script_browser)
-            self.menu.addAction(browser_action)
-            self.actions.append(browser_action)
-            
-            self.menu.addSeparator()
-            
-            if not self.scripts:
-                no_scripts_action = QAction(f"❌ {tr('no_scripts_found')}", self.iface.mainWindow())
-                no_scripts_action.setEnabled(False)
-                self.menu.addAction(no_scripts_action)
-                self.actions.append(no_scripts_action)
-            else:
-                quick_menu = self.menu.addMenu(f"⚡ {tr('quick_access')} ({len(self.scripts)} scripts)")
-                
-                for filename, script_info in sorted(self.scripts.items()):
-                    action = QAction(script_info['name'], self.iface.mainWindow())
-                    
-                    action.hovered.connect(
-                        lambda desc=script_info['description'], name=script_info['name']: 
-                        show_status_message(f"💡 {name}: {desc}", 5000)
-                    )
-                    
-                    action.triggered.connect(
-                        lambda checked, path=script_info['path']: 
-                        self.execute_script(path, capture_output=False)
-                    )
-                    
-                    quick_menu.addAction(action)
-                    self.actions.append(action)
-                
-                quick_menu.aboutToHide.connect(lambda: show_status_message("", 1))
+            labels = get_translator().labels
+            if self.quick_menu is None:
+                self.build_static_menu(labels)
             
-            self.menu.addSeparator()
+            # Script actions are only built when the submenu is first opened
+            self._quick_menu_dirty = True
             
-            reload_action = QAction(f"🔄 {tr('reload_scripts')}", self.iface.mainWindow())
-            reload_action.setToolTip(tr('tooltip_reload'))
-            reload_action.triggered.connect(self.reload_scripts)
-            self.menu.addAction(reload_action)
-            self.actions.append(reload_action)
-            
-            open_folder_action = QAction(f"📁 {tr('open_scripts_folder')}", self.iface.mainWindow())
-            open_folder_action.setToolTip(tr('tooltip_folder'))
-            open_folder_action.triggered.connect(self.open_scripts_folder)
-            self.menu.addAction(open_folder_action)
-            self.actions.append(open_folder_action)
-            
-            info_action = QAction(f"ℹ️ {tr('about')}", self.iface.mainWindow())
-            info_action.setToolTip(tr('tooltip_about'))
-            info_action.triggered.connect(self.show_info)
-            self.menu.addAction(info_action)
-            self.actions.append(info_action)
+            has_scripts = bool(self.scripts)
+            self.no_scripts_action.setVisible(not has_scripts)
+            self.quick_menu.menuAction().setVisible(has_scripts)
+            self.quick_menu.setTitle(labels['menu_quick_access'] + " (" + str(len(self.scripts)) + " scripts)")
             
         except Exception as e:
             QgsMessageLog.logMessage(f"Error creating menu: {str(e)}", 
                                    "Script Manager", Qgis.Critical)
+        finally:
+            self.menu.blockSignals(False)
+    
+    def build_static_menu(self, labels):
+        """Create the fixed menu entries; script actions are synced separately"""
+        self.menu.clear()
+        # Owned by the menu, so Qt deletes them together with it
+        parent = self.menu
+        
+        browser_action = QAction(labels['menu_browser'], parent)
+        browser_action.setToolTip(tr('tooltip_browser'))
+        browser_action.triggered.connect(self.open_script_browser)
+        
+        self.no_scripts_action = QAction(labels['menu_no_scripts'], parent)
+        self.no_scripts_action.setEnabled(False)
+        
+        self.quick_menu = QMenu(labels['menu_quick_access'], self.menu)
+        self.quick_menu.aboutToShow.connect(self.populate_quick_menu)
+        self.quick_menu.hovered.connect(self.on_script_hovered)
+        self.quick_menu.triggered.connect(self.on_script_triggered)
+        self.quick_menu.aboutToHide.connect(lambda: self.show_status_message("", 1))
+        
+        reload_action = QAction(labels['menu_reload'], parent)
+        reload_action.setToolTip(tr('tooltip_reload'))
+        reload_action.triggered.connect(self.request_reload)
+        
+        open_folder_action = QAction(labels['menu_open_folder'], parent)
+        open_folder_action.setToolTip(tr('tooltip_folder'))
+        open_folder_action.triggered.connect(self.open_scripts_folder)
+        
+        info_action = QAction(labels['menu_about'], parent)
+        info_action.setToolTip(tr('tooltip_about'))
+        info_action.triggered.connect(self.show_info)
+        
+        separators = []
+        for _ in range(2):
+            separator = QAction(parent)
+            separator.setSeparator(True)
+            separators.append(separator)
+        
+        # Added in one call so the menu lays out once
+        self.menu.addActions([
+            browser_action,
+            separators[0],
+            self.no_scripts_action,
+            self.quick_menu.menuAction(),
+            separators[1],
+            reload_action,
+            open_folder_action,
+            info_action,
+        ])
+    
+    def on_script_hovered(self, action):
+        script_info = self.scripts.get(action.data())
+        if script_info:
+            self.show_status_message(f"💡 {script_info['name']}: {script_info['description']}", 5000)
+    
+    def on_script_triggered(self, action):
+        # Look the script up on use so reused actions follow edits
+        script_info = self.scripts.get(action.data())
+        if script_info:
+            self.execute_script(script_info['path'], capture_output=False)
+    
+    def populate_quick_menu(self):
+        # The folder watch misses in-place saves; a stat-only rescan catches edited headers
+        self.refresh_scripts()
+        self.populate_quick_menu_actions()
+    
+    def populate_quick_menu_actions(self):
+        if self._quick_menu_dirty:
+            self.sync_quick_actions()
+            self._quick_menu_dirty = False
+    
+    def sync_quick_actions(self):
+        """Add, remove and rename quick access actions to match the loaded scripts"""
+        names = self._action_names
+        
+        for filename in self._action_by_name.keys() - self.scripts.keys():
+            action = self._action_by_name.pop(filename)
+            self.quick_menu.removeAction(action)
+            action.deleteLater()
+            del names[bisect.bisect_left(names, filename)]
+        
+        # An empty submenu gets all its actions in one addActions call
+        batch = [] if not names else None
+        
+        for filename, script_info in self.sorted_scripts:
+            action = self._action_by_name.get(filename)
+            if action is not None:
+                action.setText(script_info['name'])
+                continue
+            
+            # Triggering is handled once by the submenu's triggered signal
+            action = QAction(script_info['name'], self.quick_menu)
+            action.setData(filename)
+            
+            self._action_by_name[filename] = action
+            if batch is not None:
+                batch.append(action)
+                names.append(filename)
+                continue
+            
+            row = bisect.bisect_left(names, filename)
+            before = self._action_by_name[names[row]] if row < len(names) else None
+            self.quick_menu.insertAction(before, action)
+            names.insert(row, filename)
+        
+        if batch:
+            self.quick_menu.addActions(batch)
     
     def open_script_browser(self):
         try:
+            # Pick up scripts edited in place since the last scan; applied when it lands
+            self.refresh_scripts()
+            
             if not self.scripts:
-                show_status_message(f"⚠️ {tr('no_scripts_warning')}", 3000, True)
+                self.show_status_message(f"⚠️ {tr('no_scripts_warning')}", 3000, True)
                 return
             
-            if self.browser_dialog:
-                self.browser_dialog.close()
+            if self.browser_dialog is None:
+                self.browser_dialog = ScriptBrowserDialog(
+                    self.scripts, self.execute_script, self.iface.mainWindow(),
+                    refresh_callback=self.reload_and_return_scripts,
+                    sorted_scripts=self.sorted_scripts
+                )
+            elif self.browser_dialog.sync_scripts(self.scripts):
+                self.browser_dialog.on_script_selected(self.browser_dialog.script_list.currentItem(), None)
             
-            self.browser_dialog = ScriptBrowserDialog(
-                self.scripts, self.execute_script, self.iface.mainWindow(),
-                refresh_callback=self.reload_and_return_scripts
-            )
             self.browser_dialog.show()
+            self.browser_dialog.raise_()
+            self.browser_dialog.activateWindow()
             
-            show_status_message(f"📚 {tr('browser_opened')} {len(self.scripts)} scripts", 2000)
+            self.show_status_message(f"📚 {tr('browser_opened')} {len(self.scripts)} scripts", 2000)
             
         except Exception as e:
             QgsMessageLog.logMessage(f"Error opening script browser: {str(e)}", 
@@ -1111,10 +1691,7 @@ if __name__ == "__main__":
         validation_warnings = []
         
         try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                script_content = f.read()
-            
-            validation_warnings = self.executor.validate_script_imports(script_content)
+            code, validation_warnings = self.executor.get_code(script_path)
             
             if validation_warnings and not capture_output:
                 warning_text = "\n".join(validation_warnings)
@@ -1128,25 +1705,19 @@ if __name__ == "__main__":
             
             script_globals = self.executor.prepare_safe_namespace(script_path)
             
-            original_path = sys.path.copy()
-            
-            try:
-                script_dir = os.path.dirname(script_path)
-                if script_dir not in sys.path:
-                    sys.path.insert(0, script_dir)
-                
+            with script_dir_on_path(os.path.dirname(script_path)):
                 if capture_output:
                     with self.executor.capture_output():
-                        exec(script_content, script_globals)  # nosec B102
+                        exec(code, script_globals)  # nosec B102
                     captured_output, captured_errors = self.executor.get_captured_output()
                 else:
-                    exec(script_content, script_globals)  # nosec B102
+                    exec(code, script_globals)  # nosec B102
                 
                 success = True
                 
                 script_name = os.path.basename(script_path)
                 if not capture_output:
-                    show_status_message(f"✅ {tr('script_executed').replace('!', '')} '{script_name}'!", 3000)
+                    self.show_status_message(f"✅ {get_translator().labels['script_executed_bare']} '{script_name}'!", 3000)
                     
                 QgsMessageLog.logMessage(f"✅ Script executed successfully: {script_name}", 
                                        "Script Manager", Qgis.Success)
@@ -1154,9 +1725,6 @@ if __name__ == "__main__":
                 if captured_output.strip():
                     QgsMessageLog.logMessage(f"📤 {tr('output_captured')}:\n{captured_output}", 
                                            "Script Manager", Qgis.Info)
-            
-            finally:
-                sys.path = original_path
         
         except Exception as e:
             script_name = os.path.basename(script_path)
@@ -1166,7 +1734,7 @@ if __name__ == "__main__":
             captured_errors = detailed_error
             
             if not capture_output:
-                show_status_message(f"❌ {tr('error')} '{script_name}'", 5000, True)
+                self.show_status_message(f"❌ {tr('error')} '{script_name}'", 5000, True)
                 QMessageBox.critical(None, tr('script_error'), 
                                    f"{tr('error_executing')} '{script_name}':\n\n{str(e)}\n\n{tr('check_log')}")
             
@@ -1179,45 +1747,84 @@ if __name__ == "__main__":
     
     def reload_and_return_scripts(self):
         """Recarrega scripts do disco e retorna o dicionário atualizado."""
-        self.load_scripts()
-        self.create_menu()
+        if self.load_scripts():
+            self.create_menu()
         return self.scripts
 
     def reload_scripts(self):
-        self.reload_timer.start(500)
+        if self._reload_pending:
+            return
+        
+        # Reload right away after a quiet period; later events within the
+        # window share one trailing reload that picks up the final state
+        self._reload_pending = True
+        elapsed = time.monotonic() - self._last_reload
+        QTimer.singleShot(0 if elapsed >= 0.5 else 500, self._do_reload)
+    
+    def request_reload(self):
+        """Reload on the user's request; unlike watcher reloads, it always reports back"""
+        self._reload_requested = True
+        self.reload_scripts()
+    
+    def _do_reload(self):
+        self._reload_pending = False
+        # A reload scheduled just before unload must not start a scan
+        if self.menu is None:
+            return
+        self._last_reload = time.monotonic()
+        self.load_scripts_async(self.update_menu)
+    
+    def publish_scan(self, scan):
+        """Apply a scan to the menu and an open browser; returns False when nothing changed"""
+        if not self.apply_scan(scan):
+            return False
+        self.create_menu()
+        # An open submenu is not shown again, so sync its actions now
+        if self.quick_menu is not None and self.quick_menu.isVisible():
+            self.populate_quick_menu_actions()
+        dialog = self.browser_dialog
+        if dialog is not None and dialog.isVisible() and dialog.sync_scripts(self.scripts):
+            dialog.on_script_selected(dialog.script_list.currentItem(), None)
+        return True
     
-    def update_menu(self):
+    def refresh_scripts(self):
+        """Rescan in the background unless a scan is already under way"""
+        # A running scan publishes its own result; queueing would displace a pending reload
+        if not self._scan_running:
+            self.load_scripts_async(self.refresh_from_scan)
+    
+    def refresh_from_scan(self, scan):
         try:
-            self.load_scripts()
-            self.create_menu()
-            show_status_message(f"🔄 {tr('scripts_reloaded')} ({len(self.scripts)} scripts)", 2000)
-            QgsMessageLog.logMessage("🔄 Scripts reloaded successfully", "Script Manager", Qgis.Info)
+            self.publish_scan(scan)
+        except Exception as e:
+            QgsMessageLog.logMessage(f"Error refreshing scripts: {str(e)}", 
+                                   "Script Manager", Qgis.Warning)
+    
+    def update_menu(self, scan):
+        try:
+            changed = self.publish_scan(scan)
+            # Network polls land here every 30 s; stay quiet when nothing changed
+            if changed or self._reload_requested:
+                self._reload_requested = False
+                self.show_status_message(f"🔄 {tr('scripts_reloaded')} ({len(self.scripts)} scripts)", 2000)
+                QgsMessageLog.logMessage("🔄 Scripts reloaded successfully", "Script Manager", Qgis.Info)
         except Exception as e:
             QgsMessageLog.logMessage(f"Error updating menu: {str(e)}", 
                                    "Script Manager", Qgis.Critical)
     
     def open_scripts_folder(self):
-        import subprocess
-        import platform
-        
         try:
-            if platform.system() == "Windows":
-                os.startfile(self.scripts_dir)
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", self.scripts_dir])
-            else:
-                subprocess.run(["xdg-open", self.scripts_dir])
-                
+            _OPEN_FOLDER(self.scripts_dir)
         except Exception as e:
             QMessageBox.information(
                 None, tr('open_scripts_folder'), 
                 f"{tr('scripts_location')}:\n{self.scripts_dir}\n\n{tr('error_opening_folder')}: {str(e)}"
             )
     
-    def show_info(self):
-        lang = _translator.current_language
+    def build_about_html(self):
+        lang = get_translator().current_language
         
-        info_text = f"""
+        return f"""
 <h3>📋 {tr('about_title')}</h3>
 <p><b>{tr('about_subtitle')}</b></p>
 <p>{tr('about_description')}</p>
@@ -1277,16 +1884,31 @@ if __name__ == "__main__":
 <p><i>For more information and examples, visit the plugin documentation.</i></p>
         """
     
-        dialog = QDialog()
+    def show_info(self):
+        # The text only varies with the script count; the dialog itself is built once
+        if self._about_dialog is None:
+            self._about_dialog = self.build_about_dialog()
+            self._about_html = None
+        
+        script_count = len(self.scripts)
+        if self._about_html is None or self._about_html[0] != script_count:
+            self._about_html = (script_count, self.build_about_html())
+            self._about_label.setText(self._about_html[1])
+        
+        EXEC_DIALOG(self._about_dialog)
+    
+    def build_about_dialog(self):
+        dialog = QDialog(self.iface.mainWindow())
         dialog.setWindowTitle(tr('about'))
         dialog.resize(650, 550)
         dialog.setMinimumSize(650, 550)
         
         layout = QVBoxLayout()
         
-        label = QLabel(info_text)
-        label.setTextFormat(QtCompat.get_rich_text())
+        label = QLabel()
+        label.setTextFormat(RICH_TEXT)
         label.setWordWrap(True)
+        self._about_label = label
         
         scroll = QScrollArea()
         scroll.setWidget(label)
@@ -1304,8 +1926,7 @@ if __name__ == "__main__":
         layout.addWidget(scroll)
         layout.addLayout(button_layout)
         dialog.setLayout(layout)
-        
-        QtCompat.exec_dialog(dialog)
+        return dialog
 
 
 def classFactory(iface):
@@ -6,34 +6,84 @@ Description: Analyzes project layers and generates comprehensive statistics incl
 
 # Qt compatibility imports for PyQt5/PyQt6
 try:
-    from PyQt6.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QTextEdit, QPushButton, QLabel
+    from PyQt6.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QLabel
     from PyQt6.QtCore import Qt, QTimer
     from PyQt6.QtGui import QFont
     QT_VERSION = 6
 except ImportError:
-    from PyQt5.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QTextEdit, QPushButton, QLabel
+    from PyQt5.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QLabel
     from PyQt5.QtCore import Qt, QTimer
     from PyQt5.QtGui import QFont
     QT_VERSION = 5
 
 from qgis.core import (
-    QgsProject, QgsVectorLayer, QgsRasterLayer, 
-    QgsWkbTypes, QgsUnitTypes, QgsMessageLog, Qgis
+    QgsProject, QgsWkbTypes, QgsUnitTypes, QgsMessageLog, Qgis
 )
 from qgis.utils import iface
+import io
 import time
+from collections import Counter
 from datetime import datetime
 
+# Layer kind enum: Qgis.LayerType since QGIS 3.30, QgsMapLayerType before
+try:
+    VECTOR_LAYER = Qgis.LayerType.Vector
+    RASTER_LAYER = Qgis.LayerType.Raster
+except AttributeError:
+    from qgis.core import QgsMapLayerType
+    VECTOR_LAYER = QgsMapLayerType.VectorLayer
+    RASTER_LAYER = QgsMapLayerType.RasterLayer
+
 
 class LayerStatisticsDialog(QDialog):
     """Dialog to display layer statistics in a formatted window"""
     
+    # Shared across dialog instances; the font needs a QApplication, so it is built on first use
+    _TITLE_FONT = None
+    _TITLE_QSS = "color: #2E86AB; margin-bottom: 10px;"
+    _TEXT_AREA_QSS = """
+        QPlainTextEdit {
+            background-color: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 4px;
+            padding: 8px;
+            font-family: 'Courier New', monospace;
+            font-size: 11px;
+        }
+    """
+    _BUTTON_QSS = """
+        QPushButton {
+            background-color: #28a745;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #218838;
+        }
+    """
+    
+    @classmethod
+    def title_font(cls):
+        """Return the shared bold title font, creating it on first use"""
+        if cls._TITLE_FONT is None:
+            font = QFont()
+            font.setPointSize(12)
+            if QT_VERSION == 6:
+                font.setWeight(QFont.Weight.Bold)
+            else:
+                font.setWeight(QFont.Bold)
+            cls._TITLE_FONT = font
+        return cls._TITLE_FONT
+    
     def __init__(self, statistics_text, parent=None):
         super().__init__(parent)
-        self.statistics_text = statistics_text
-        self.setup_ui()
+        # The text goes straight into the widget; keeping a second copy would double memory
+        self.setup_ui(statistics_text)
     
-    def setup_ui(self):
+    def setup_ui(self, statistics_text):
         """Setup the dialog user interface"""
         self.setWindowTitle("📊 Layer Statistics Report")
         self.setModal(False)
@@ -43,48 +93,22 @@ class LayerStatisticsDialog(QDialog):
         
         # Title
         title = QLabel("📊 Project Layer Statistics")
-        title_font = QFont()
-        title_font.setPointSize(12)
-        if QT_VERSION == 6:
-            title_font.setWeight(QFont.Weight.Bold)
-        else:
-            title_font.setWeight(QFont.Bold)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #2E86AB; margin-bottom: 10px;")
+        title.setFont(self.title_font())
+        title.setStyleSheet(self._TITLE_QSS)
         layout.addWidget(title)
         
-        # Statistics text area
-        self.text_area = QTextEdit()
+        # Statistics text area; QPlainTextEdit lays out large plain reports
+        # line by line instead of building a rich-text document
+        self.text_area = QPlainTextEdit()
         self.text_area.setReadOnly(True)
-        self.text_area.setPlainText(self.statistics_text)
-        self.text_area.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 8px;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-            }
-        """)
+        self.text_area.setPlainText(statistics_text)
+        self.text_area.setStyleSheet(self._TEXT_AREA_QSS)
         layout.addWidget(self.text_area)
         
         # Close button
         close_btn = QPushButton("✅ Close")
         close_btn.clicked.connect(self.accept)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        close_btn.setStyleSheet(self._BUTTON_QSS)
         layout.addWidget(close_btn)
         
         self.setLayout(layout)
@@ -97,19 +121,48 @@ class LayerStatisticsDialog(QDialog):
             return self.exec_()
 
 
+# Report separators
+REPORT_RULE = "=" * 80
+SECTION_RULE = "-" * 40
+
+# Per-layer report blocks, parsed once and filled with str.format_map
+VECTOR_BLOCK = (
+    "{index}. {name}\n"
+    "   Geometry: {geometry_type}\n"
+    "   Features: {features}\n"
+    "   Fields: {fields_count}\n"
+    "   CRS: {crs} ({crs_description})\n"
+    "   Provider: {provider}\n"
+    "   Field Details: {field_details}\n"
+)
+RASTER_BLOCK = (
+    "{index}. {name}\n"
+    "   Dimensions: {width} x {height} pixels\n"
+    "   Bands: {band_count}\n"
+    "   CRS: {crs} ({crs_description})\n"
+    "   Provider: {provider}\n"
+)
+EXTENT_LINE = "   Extent: X({0:.2f}, {1:.2f}) Y({2:.2f}, {3:.2f})\n"
+
+# Field details are listed only for layers with at most this many fields
+MAX_LISTED_FIELDS = 10
+
+# Human-readable names for the common WKB types, built once
+GEOMETRY_TYPE_NAMES = {
+    QgsWkbTypes.Point: "Point",
+    QgsWkbTypes.LineString: "Line",
+    QgsWkbTypes.Polygon: "Polygon",
+    QgsWkbTypes.MultiPoint: "MultiPoint",
+    QgsWkbTypes.MultiLineString: "MultiLine",
+    QgsWkbTypes.MultiPolygon: "MultiPolygon",
+    QgsWkbTypes.NoGeometry: "Table (No Geometry)",
+    QgsWkbTypes.Unknown: "Unknown"
+}
+
+
 def get_geometry_type_name(geometry_type):
     """Get human-readable geometry type name"""
-    geometry_types = {
-        QgsWkbTypes.Point: "Point",
-        QgsWkbTypes.LineString: "Line",
-        QgsWkbTypes.Polygon: "Polygon",
-        QgsWkbTypes.MultiPoint: "MultiPoint",
-        QgsWkbTypes.MultiLineString: "MultiLine",
-        QgsWkbTypes.MultiPolygon: "MultiPolygon",
-        QgsWkbTypes.NoGeometry: "Table (No Geometry)",
-        QgsWkbTypes.Unknown: "Unknown"
-    }
-    return geometry_types.get(geometry_type, f"Type {geometry_type}")
+    return GEOMETRY_TYPE_NAMES.get(geometry_type, f"Type {geometry_type}")
 
 
 def format_file_size(size_bytes):
@@ -124,52 +177,104 @@ def format_file_size(size_bytes):
     return f"{size_bytes:.1f} {size_names[i]}"
 
 
+def vector_extent(layer, provider, wkb_type):
+    """Return the layer extent, preferring the provider's stored metadata"""
+    # Tables have no extent, and asking some providers for one is expensive
+    if wkb_type == QgsWkbTypes.NoGeometry:
+        return None
+    # Only the layer knows about features added in an open edit session
+    if layer.isEditable():
+        return layer.extent()
+    return provider.extent()
+
+
 def analyze_vector_layer(layer):
     """Analyze a vector layer and return statistics"""
-    stats = {
+    # Each accessor crosses into C++, so fetch every object only once
+    crs = layer.crs()
+    fields = layer.fields()
+    wkb_type = layer.wkbType()
+    provider = layer.dataProvider()
+    fields_count = len(fields)
+    # The report only lists fields for narrow tables, so skip formatting wide ones
+    if fields_count <= MAX_LISTED_FIELDS:
+        fields_info = [f"{field.name()} ({field.typeName()})" for field in fields]
+    else:
+        fields_info = None
+    
+    return {
         'name': layer.name(),
         'type': 'Vector',
         'feature_count': layer.featureCount(),
-        'geometry_type': get_geometry_type_name(layer.wkbType()),
-        'crs': layer.crs().authid(),
-        'crs_description': layer.crs().description(),
-        'provider': layer.dataProvider().name(),
+        'geometry_type': get_geometry_type_name(wkb_type),
+        'crs': crs.authid(),
+        'crs_description': crs.description(),
+        'provider': provider.name(),
         'source': layer.source(),
-        'fields_count': len(layer.fields()),
-        'extent': layer.extent()
+        'fields_count': fields_count,
+        'fields': fields_info,
+        'extent': vector_extent(layer, provider, wkb_type)
     }
-    
-    # Get field information
-    fields_info = []
-    for field in layer.fields():
-        field_info = f"{field.name()} ({field.typeName()})"
-        fields_info.append(field_info)
-    stats['fields'] = fields_info
-    
-    return stats
 
 
 def analyze_raster_layer(layer):
     """Analyze a raster layer and return statistics"""
-    stats = {
+    crs = layer.crs()
+    provider = layer.dataProvider()
+    
+    return {
         'name': layer.name(),
         'type': 'Raster',
         'band_count': layer.bandCount(),
         'width': layer.width(),
         'height': layer.height(),
-        'crs': layer.crs().authid(),
-        'crs_description': layer.crs().description(),
-        'provider': layer.dataProvider().name(),
+        'crs': crs.authid(),
+        'crs_description': crs.description(),
+        'provider': provider.name(),
         'source': layer.source(),
-        'extent': layer.extent()
+        'extent': provider.extent()
     }
+
+
+# Analyzer per layer kind; other kinds (mesh, vector tiles...) are skipped
+LAYER_ANALYZERS = {
+    VECTOR_LAYER: analyze_vector_layer,
+    RASTER_LAYER: analyze_raster_layer
+}
+
+
+def analyze_layers(layers):
+    """Analyze every supported layer and return (vector, raster, total features, geometry counts)"""
+    # Initialize counters
+    vector_layers = []
+    raster_layers = []
+    total_features = 0
+    geometry_summary = Counter()
+    
+    # Analyze each layer, dispatching on the enum from a single layer.type() call
+    buckets = {VECTOR_LAYER: vector_layers, RASTER_LAYER: raster_layers}
+    for layer in layers.values():
+        layer_type = layer.type()
+        analyze = LAYER_ANALYZERS.get(layer_type)
+        if analyze is None:
+            continue
+        
+        layer_stats = analyze(layer)
+        buckets[layer_type].append(layer_stats)
+        if layer_type == VECTOR_LAYER:
+            geometry_summary[layer_stats['geometry_type']] += 1
+            # featureCount() is -1 when the provider cannot count cheaply
+            if layer_stats['feature_count'] >= 0:
+                total_features += layer_stats['feature_count']
     
-    return stats
+    return vector_layers, raster_layers, total_features, geometry_summary
 
 
 def generate_statistics_report():
     """Generate comprehensive project statistics"""
-    start_time = time.time()
+    # Stamp the report before timing starts so only the analysis is measured
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    start_time = time.perf_counter()
     
     # Get all layers from project
     project = QgsProject.instance()
@@ -178,117 +283,115 @@ def generate_statistics_report():
     if not layers:
         return "❌ No layers found in the current project."
     
-    # Initialize counters
-    vector_layers = []
-    raster_layers = []
-    total_features = 0
-    
-    # Analyze each layer
-    for layer_id, layer in layers.items():
-        if isinstance(layer, QgsVectorLayer):
-            layer_stats = analyze_vector_layer(layer)
-            vector_layers.append(layer_stats)
-            total_features += layer_stats['feature_count']
-        elif isinstance(layer, QgsRasterLayer):
-            layer_stats = analyze_raster_layer(layer)
-            raster_layers.append(layer_stats)
+    # Always analyze afresh: saved edits, open edit buffers and external source
+    # changes leave the project untouched, so no project-level key can tell when
+    # the counts, extents and fields went stale
+    vector_layers, raster_layers, total_features, geometry_summary = analyze_layers(layers)
     
-    # Generate report
-    report_lines = []
-    report_lines.append("=" * 80)
-    report_lines.append("📊 QGIS PROJECT LAYER STATISTICS REPORT")
-    report_lines.append("=" * 80)
-    report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report_lines.append(f"Qt Version: {QT_VERSION}")
-    report_lines.append(f"Project: {project.baseName() or 'Untitled Project'}")
-    report_lines.append("")
+    total_layers = len(layers)
     
-    # Summary statistics
-    report_lines.append("📋 SUMMARY")
-    report_lines.append("-" * 40)
-    report_lines.append(f"Total Layers: {len(layers)}")
-    report_lines.append(f"Vector Layers: {len(vector_layers)}")
-    report_lines.append(f"Raster Layers: {len(raster_layers)}")
-    report_lines.append(f"Total Features: {total_features:,}")
-    report_lines.append("")
+    # Generate report into one growing buffer; each print writes a whole block
+    report = io.StringIO()
+    print(
+        REPORT_RULE,
+        "📊 QGIS PROJECT LAYER STATISTICS REPORT",
+        REPORT_RULE,
+        f"Generated: {generated_at}",
+        f"Qt Version: {QT_VERSION}",
+        f"Project: {project.baseName() or 'Untitled Project'}",
+        "",
+        # Summary statistics
+        "📋 SUMMARY",
+        SECTION_RULE,
+        f"Total Layers: {total_layers}",
+        f"Vector Layers: {len(vector_layers)}",
+        f"Raster Layers: {len(raster_layers)}",
+        f"Total Features: {total_features:,}",
+        "",
+        sep="\n", file=report
+    )
     
     # Vector layers details
     if vector_layers:
-        report_lines.append("🗺️ VECTOR LAYERS")
-        report_lines.append("-" * 40)
+        print("🗺️ VECTOR LAYERS", SECTION_RULE, sep="\n", file=report)
         
+        write = report.write
         for i, layer_stats in enumerate(vector_layers, 1):
-            report_lines.append(f"{i}. {layer_stats['name']}")
-            report_lines.append(f"   Geometry: {layer_stats['geometry_type']}")
-            report_lines.append(f"   Features: {layer_stats['feature_count']:,}")
-            report_lines.append(f"   Fields: {layer_stats['fields_count']}")
-            report_lines.append(f"   CRS: {layer_stats['crs']} ({layer_stats['crs_description']})")
-            report_lines.append(f"   Provider: {layer_stats['provider']}")
-            
             # Show field details for smaller field counts
-            if layer_stats['fields_count'] <= 10:
-                report_lines.append(f"   Field Details: {', '.join(layer_stats['fields'])}")
+            if layer_stats['fields'] is not None:
+                field_details = ', '.join(layer_stats['fields'])
             else:
-                report_lines.append(f"   Field Details: {layer_stats['fields_count']} fields (too many to display)")
+                field_details = f"{layer_stats['fields_count']} fields (too many to display)"
+            
+            feature_count = layer_stats['feature_count']
+            write(VECTOR_BLOCK.format_map({
+                **layer_stats,
+                'index': i,
+                'features': f"{feature_count:,}" if feature_count >= 0 else "Unknown",
+                'field_details': field_details,
+            }))
             
             # Extent information
             extent = layer_stats['extent']
-            report_lines.append(f"   Extent: X({extent.xMinimum():.2f}, {extent.xMaximum():.2f}) "
-                              f"Y({extent.yMinimum():.2f}, {extent.yMaximum():.2f})")
-            report_lines.append("")
+            if extent is not None:
+                write(EXTENT_LINE.format(extent.xMinimum(), extent.xMaximum(),
+                                         extent.yMinimum(), extent.yMaximum()))
+            write("\n")
     
     # Raster layers details
     if raster_layers:
-        report_lines.append("🖼️ RASTER LAYERS")
-        report_lines.append("-" * 40)
+        print("🖼️ RASTER LAYERS", SECTION_RULE, sep="\n", file=report)
         
+        write = report.write
         for i, layer_stats in enumerate(raster_layers, 1):
-            report_lines.append(f"{i}. {layer_stats['name']}")
-            report_lines.append(f"   Dimensions: {layer_stats['width']} x {layer_stats['height']} pixels")
-            report_lines.append(f"   Bands: {layer_stats['band_count']}")
-            report_lines.append(f"   CRS: {layer_stats['crs']} ({layer_stats['crs_description']})")
-            report_lines.append(f"   Provider: {layer_stats['provider']}")
-            
-            # Extent information
             extent = layer_stats['extent']
-            report_lines.append(f"   Extent: X({extent.xMinimum():.2f}, {extent.xMaximum():.2f}) "
-                              f"Y({extent.yMinimum():.2f}, {extent.yMaximum():.2f})")
-            report_lines.append("")
+            write(RASTER_BLOCK.format_map({**layer_stats, 'index': i}))
+            write(EXTENT_LINE.format(extent.xMinimum(), extent.xMaximum(),
+                                     extent.yMinimum(), extent.yMaximum()))
+            write("\n")
     
     # Performance information
-    processing_time = time.time() - start_time
-    report_lines.append("⚡ PERFORMANCE")
-    report_lines.append("-" * 40)
-    report_lines.append(f"Analysis completed in: {processing_time:.3f} seconds")
-    report_lines.append(f"Average processing per layer: {(processing_time/len(layers)):.3f} seconds")
-    report_lines.append("")
+    processing_time = time.perf_counter() - start_time
+    average_time = processing_time / total_layers if total_layers else 0.0
+    print(
+        "⚡ PERFORMANCE",
+        SECTION_RULE,
+        f"Analysis completed in: {processing_time:.3f} seconds",
+        f"Average processing per layer: {average_time:.3f} seconds",
+        "",
+        sep="\n", file=report
+    )
     
     # Geometry type summary for vector layers
     if vector_layers:
-        geometry_summary = {}
-        for layer_stats in vector_layers:
-            geom_type = layer_stats['geometry_type']
-            if geom_type in geometry_summary:
-                geometry_summary[geom_type] += 1
-            else:
-                geometry_summary[geom_type] = 1
-        
-        report_lines.append("📐 GEOMETRY TYPE SUMMARY")
-        report_lines.append("-" * 40)
-        for geom_type, count in geometry_summary.items():
-            report_lines.append(f"{geom_type}: {count} layer(s)")
-        report_lines.append("")
+        print("📐 GEOMETRY TYPE SUMMARY", SECTION_RULE, sep="\n", file=report)
+        for geom_type, count in geometry_summary.most_common():
+            print(f"{geom_type}: {count} layer(s)", file=report)
+        print(file=report)
     
-    report_lines.append("=" * 80)
-    report_lines.append("Report completed successfully! 🎉")
-    report_lines.append("=" * 80)
+    # The last line has no trailing newline, as before
+    print(
+        REPORT_RULE,
+        "Report completed successfully! 🎉",
+        REPORT_RULE,
+        sep="\n", end="", file=report
+    )
     
-    return "\n".join(report_lines)
+    return report.getvalue()
 
 
 def main():
     """Main function to execute layer statistics analysis"""
     try:
+        # Nothing to analyze: skip the report and the dialog entirely
+        if not QgsProject.instance().count():
+            QMessageBox.information(
+                iface.mainWindow(),
+                "Layer Statistics",
+                "No layers in project."
+            )
+            return
+        
         # Show initial message
         iface.messageBar().pushMessage(
             "Layer Statistics", 